@@ -3,7 +3,7 @@ import abc
 from mode import Service
 
 from dagger.exceptions.exceptions import TaskInvalidState
-from dagger.tasks.task import ITemplateDAGInstance, TaskStatus, TaskStatusEnum
+from dagger.tasks.task import ITemplateDAGInstance, TaskStatusEnum, status_of
 
 
 class ExecutorStrategy:
@@ -25,9 +25,7 @@ class SerialExecutorStrategy(ExecutorStrategy):
         self, task_template: ITemplateDAGInstance, *, repartition: bool = True
     ) -> None:
         if task_template.status.code != TaskStatusEnum.COMPLETED.name:
-            task_template.status = TaskStatus(
-                code=TaskStatusEnum.SUBMITTED.name, value=TaskStatusEnum.SUBMITTED.value
-            )
+            task_template.status = status_of(TaskStatusEnum.SUBMITTED)
             if repartition:
                 key_value = (
                     task_template.runtime_parameters.get(
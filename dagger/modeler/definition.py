@@ -17,9 +17,9 @@ from dagger.tasks.task import (
     ITemplateDAGInstance,
     ParallelCompositeTask,
     TaskOperator,
-    TaskStatus,
     TaskStatusEnum,
     TaskType,
+    status_of,
 )
 from dagger.templates.template import (
     IDynamicProcessTemplateDAG,
@@ -148,9 +148,7 @@ class ProcessTemplateDAG(IProcessTemplateDAG):
         process_instance.task_type = TaskType.SUB_DAG.name
         process_instance.max_run_duration = self.max_run_duration
         process_instance.time_created = int(time.time())
-        process_instance.status = TaskStatus(
-            code=TaskStatusEnum.NOT_STARTED.name, value=TaskStatusEnum.NOT_STARTED.value
-        )
+        process_instance.status = status_of(TaskStatusEnum.NOT_STARTED)
         process_instance.task_name = f"{parent_name}.{self.name}"
         process_instance.next_dags = list()
         dag_id = DAGIDGenerator.generate_dag_id_from_seed(seed) if seed else uuid1()
@@ -270,9 +268,7 @@ class ParallelCompositeProcessTemplateDAG(ProcessTemplateDAG):
         )
         process_instance.task_type = TaskType.PARALLEL_COMPOSITE.name
         process_instance.time_created = int(time.time())
-        process_instance.status = TaskStatus(
-            code=TaskStatusEnum.NOT_STARTED.name, value=TaskStatusEnum.NOT_STARTED.value
-        )
+        process_instance.status = status_of(TaskStatusEnum.NOT_STARTED)
         process_instance.task_name = f"{parent_name}.{self.name}"
         process_instance.next_dags = list()
         process_instance.parallel_child_task_list = list()
@@ -533,9 +529,7 @@ class TemplateDAG(ITemplateDAG):
             **kwargs,
         )
         template_instance.time_created = int(time.time())
-        template_instance.status = TaskStatus(
-            code=TaskStatusEnum.NOT_STARTED.name, value=TaskStatusEnum.NOT_STARTED.value
-        )
+        template_instance.status = status_of(TaskStatusEnum.NOT_STARTED)
         template_instance.root_dag = process_instance.id
         template_instance.add_task(task=process_instance)
         if repartition:
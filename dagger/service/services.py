@@ -4,7 +4,6 @@ import asyncio
 import json
 import logging
 import time
-import traceback
 import uuid
 from random import Random
 from typing import (
@@ -17,7 +16,7 @@ from typing import (
     Mapping,
     MutableMapping,
     Optional,
-    Set,
+    Tuple,
 )
 from uuid import UUID
 from weakref import WeakValueDictionary
@@ -191,7 +190,7 @@ class Dagger(Service):
         self.kafka_broker_list = kafka_broker_list
         self.enable_changelog = enable_changelog
         self.kwargs = kwargs
-        if hasattr(self, "_store") and self._store:
+        if getattr(self, "_store", None):
             self._store.initialize()
             self._store.enable_changelog = self.enable_changelog
         self.max_correletable_keys_in_values = max_correletable_keys_in_values
@@ -374,12 +373,11 @@ class Dagger(Service):
         )
         cor_instance_list: List[CorreletableKeyTasks] = []
         if cor_instance:
-            task_ids_to_remove: List[CorreletableLookUpKey] = list()
-            lookup_keys: Set[CorreletableLookUpKey] = set()
+            task_ids_to_remove: List[Tuple[UUID, UUID]] = list()
+            lookup_keys_by_id: Dict[Tuple[UUID, UUID], CorreletableLookUpKey] = dict()
             while cor_instance:
-                cor_instance.lookup_keys = set(cor_instance.lookup_keys)
                 cor_instance_list.append(cor_instance)
-                lookup_keys.update(cor_instance.lookup_keys)
+                lookup_keys_by_id.update(cor_instance.lookup_keys_index())
                 for lookup_key in cor_instance.lookup_keys:
                     workflow_instance = await self._invoke_store_get_value_for_key_with_timer(
                         str(lookup_key.workflow_id)  # type: ignore
@@ -401,10 +399,10 @@ class Dagger(Service):
                                 yield workflow_instance, task
                             else:
                                 logger.warning(f"task {lookup_key.task_id} not found in {workflow_instance}")  # type: ignore
-                                task_ids_to_remove.append(lookup_key)
+                                task_ids_to_remove.append((lookup_key.workflow_id, lookup_key.task_id))  # type: ignore
                     elif task is None:
                         logger.warning(f"None objectType in correletable value key {lookup_key.task_id} value {task}")  # type: ignore
-                        task_ids_to_remove.append(lookup_key)
+                        task_ids_to_remove.append((lookup_key.workflow_id, lookup_key.task_id))  # type: ignore
                     elif not isinstance(task, ITask):
                         logger.error(
                             f"Invalid objectType in kvTable key {lookup_key.task_id} value {task}"
@@ -416,9 +414,103 @@ class Dagger(Service):
                 else:
                     cor_instance = None
             if len(task_ids_to_remove) > 0:
-                lookup_keys.difference_update(task_ids_to_remove)
+                for lookup_pair in task_ids_to_remove:
+                    lookup_keys_by_id.pop(lookup_pair, None)
                 await self.persist_tasks_ids_for_correletable_keys(
-                    lookup_keys=lookup_keys, cor_instances=cor_instance_list
+                    lookup_keys=list(lookup_keys_by_id.values()),
+                    cor_instances=cor_instance_list,
+                )
+
+    async def _get_tasks_by_correlatable_keys_bulk(  # noqa: C901
+        self, lookup_keys: List[TaskLookupKey], get_completed: bool = False
+    ) -> AsyncGenerator[Optional[ITask, ITask], None]:  # type: ignore
+        """Bulk variant of _get_tasks_by_correlatable_key. The head correletable
+        key chunks for all the lookup keys are fetched concurrently and each
+        distinct workflow instance is read only once, so a payload with N
+        correlatable mappings does not issue N sequential table scans
+
+        :param lookup_keys: Key, value pairs associated with tasks
+        :param get_completed: If false it looks up only SensorTasks which are not in terminal state. If true it returns
+        tasks which are in terminal state(COMPLETED,STOPPED, FAILED, SKIPPED)
+        :return: Instances of workflow task and the SensorTask
+        """
+        if not lookup_keys:
+            return
+        head_cor_instances = await asyncio.gather(
+            *[
+                self._store.get_table_value(
+                    self._store.correletable_keys_table, str(lookup_key[1])
+                )
+                for lookup_key in lookup_keys
+            ]
+        )
+        workflow_instances: Dict[str, Optional[ITask]] = {}
+        for cor_instance in head_cor_instances:
+            if not cor_instance:
+                continue
+            cor_instance_list: List[CorreletableKeyTasks] = []
+            task_ids_to_remove: List[Tuple[UUID, UUID]] = list()
+            chain_lookup_keys_by_id: Dict[
+                Tuple[UUID, UUID], CorreletableLookUpKey
+            ] = dict()
+            while cor_instance:
+                cor_instance_list.append(cor_instance)
+                chain_lookup_keys_by_id.update(cor_instance.lookup_keys_index())
+                for cor_lookup_key in cor_instance.lookup_keys:
+                    workflow_key = str(cor_lookup_key.workflow_id)
+                    if workflow_key in workflow_instances:
+                        workflow_instance = workflow_instances[workflow_key]
+                    else:
+                        workflow_instance = (
+                            await self._invoke_store_get_value_for_key_with_timer(
+                                workflow_key
+                            )
+                        )
+                        workflow_instances[workflow_key] = workflow_instance
+                    task: Optional[ITask] = None
+                    if workflow_instance and isinstance(workflow_instance, ITask):
+                        if (
+                            workflow_instance.status.code
+                            != TaskStatusEnum.COMPLETED.name
+                            or (
+                                get_completed
+                                and workflow_instance.status.code
+                                == TaskStatusEnum.COMPLETED.name
+                            )
+                        ):
+                            task = workflow_instance.get_task(id=cor_lookup_key.task_id)
+                            if task is not None:
+                                yield workflow_instance, task
+                            else:
+                                logger.warning(
+                                    f"task {cor_lookup_key.task_id} not found in {workflow_instance}"
+                                )
+                                task_ids_to_remove.append(
+                                    (cor_lookup_key.workflow_id, cor_lookup_key.task_id)
+                                )
+                    elif task is None:
+                        logger.warning(
+                            f"None objectType in correletable value key {cor_lookup_key.task_id} value {task}"
+                        )
+                        task_ids_to_remove.append(
+                            (cor_lookup_key.workflow_id, cor_lookup_key.task_id)
+                        )
+                    elif not isinstance(task, ITask):
+                        logger.error(
+                            f"Invalid objectType in kvTable key {cor_lookup_key.task_id} value {task}"
+                        )
+                if cor_instance.overflow_key:
+                    cor_instance = await self._store.get_table_value(
+                        self._store.correletable_keys_table, cor_instance.overflow_key
+                    )
+                else:
+                    cor_instance = None
+            if len(task_ids_to_remove) > 0:
+                for lookup_pair in task_ids_to_remove:
+                    chain_lookup_keys_by_id.pop(lookup_pair, None)
+                await self.persist_tasks_ids_for_correletable_keys(
+                    lookup_keys=list(chain_lookup_keys_by_id.values()),
+                    cor_instances=cor_instance_list,
                 )
 
     async def _store_root_template_instance(
@@ -495,7 +587,7 @@ class Dagger(Service):
             )
             if not cor_instance:
                 cor_instance = CorreletableKeyTasks()
-                cor_instance.lookup_keys = set()
+                cor_instance.lookup_keys = list()
                 cor_instances.append(cor_instance)
                 cor_instance.key = new_key
 
@@ -505,7 +597,6 @@ class Dagger(Service):
                 )
             terminal_cor_instance: CorreletableKeyTasks = cor_instances[-1]
 
-            terminal_cor_instance.lookup_keys = set(terminal_cor_instance.lookup_keys)
             await self.chunk_and_store_correlatable_tasks(
                 cor_instance=terminal_cor_instance,
                 value=task_instance.id,
@@ -527,9 +618,7 @@ class Dagger(Service):
             logger.info(f"Chunking CorreletableKeyTasks for {cor_instance.key}")
             new_chunk_id: str = str(uuid.uuid1())
             new_cor_instance = CorreletableKeyTasks()
-            new_cor_instance.lookup_keys = set()
-            value_to_add = CorreletableLookUpKey(workflow_id, value)
-            new_cor_instance.lookup_keys.add(value_to_add)
+            new_cor_instance.lookup_keys = [CorreletableLookUpKey(workflow_id, value)]
             new_cor_instance.key = new_chunk_id
             cor_instance.overflow_key = new_chunk_id
             await self._store.set_table_value(
@@ -538,9 +627,11 @@ class Dagger(Service):
                 new_cor_instance,
             )
         else:
-            cor_instance.lookup_keys = set(cor_instance.lookup_keys)
-            value_to_add = CorreletableLookUpKey(workflow_id, value)
-            cor_instance.lookup_keys.add(value_to_add)
+            lookup_keys_by_id = cor_instance.lookup_keys_index()
+            lookup_keys_by_id[(workflow_id, value)] = CorreletableLookUpKey(
+                workflow_id, value
+            )
+            cor_instance.lookup_keys = list(lookup_keys_by_id.values())
 
         await self._store.set_table_value(
             self._store.correletable_keys_table, cor_instance.key, cor_instance
@@ -600,22 +691,73 @@ class Dagger(Service):
                     ] = await self.get_correletable_key_instances(
                         cor_instance=cor_instance
                     )
-                    workflow_task_ids_to_persist: Set[CorreletableLookUpKey] = set()
+                    lookup_keys_by_id: Dict[
+                        Tuple[UUID, UUID], CorreletableLookUpKey
+                    ] = dict()
                     for c_instance in cor_instances:
-                        workflow_task_ids_to_persist.update(set(c_instance.lookup_keys))
-                        remove_key = CorreletableLookUpKey(
-                            workflow_instance.id, task.id
-                        )
-                    if remove_key in workflow_task_ids_to_persist:
-                        workflow_task_ids_to_persist.remove(remove_key)
+                        lookup_keys_by_id.update(c_instance.lookup_keys_index())
+                    remove_pair = (workflow_instance.id, task.id)
+                    if remove_pair in lookup_keys_by_id:
+                        del lookup_keys_by_id[remove_pair]
                         await self.persist_tasks_ids_for_correletable_keys(
-                            lookup_keys=workflow_task_ids_to_persist,
+                            lookup_keys=list(lookup_keys_by_id.values()),
                             cor_instances=cor_instances,
                         )
 
+    async def remove_tasks_from_correletable_keys_table_bulk(  # noqa: C901
+        self, tasks: List[ITask], workflow_instance: ITemplateDAGInstance
+    ):
+        """
+        Removes a batch of tasks from the correletable keys table. Tasks sharing the
+        same correletable key are grouped so each key's chunk list is read and
+        persisted once instead of once per task
+        :param tasks: the tasks to remove from the correletable keys table
+        :param workflow_instance: the workflow instance
+        """
+        if not workflow_instance.runtime_parameters:
+            return
+        tasks_by_key: Dict[str, List[ITask]] = {}
+        for task in tasks:
+            current_key = (
+                workflow_instance.runtime_parameters.get(task.correlatable_key, None)
+                if task.correlatable_key
+                else None
+            )
+            if (
+                task.correlatable_key
+                and current_key
+                and isinstance(task, SensorTask)
+                and getattr(task, "_topic", None)
+            ):
+                new_key = f"{current_key}_{task._topic.get_topic_name()}"
+                tasks_by_key.setdefault(new_key, []).append(task)
+        for new_key, key_tasks in tasks_by_key.items():
+            logger.debug(
+                f"Removing {len(key_tasks)} task(s) from correletable_keys_table with key {new_key}"
+            )
+            cor_instance: CorreletableKeyTasks = await self._store.get_table_value(
+                self._store.correletable_keys_table, new_key
+            )
+            if not cor_instance:
+                continue
+            cor_instances: List[
+                CorreletableKeyTasks
+            ] = await self.get_correletable_key_instances(cor_instance=cor_instance)
+            lookup_keys_by_id: Dict[Tuple[UUID, UUID], CorreletableLookUpKey] = dict()
+            for c_instance in cor_instances:
+                lookup_keys_by_id.update(c_instance.lookup_keys_index())
+            remove_pairs = {(workflow_instance.id, task.id) for task in key_tasks}
+            if lookup_keys_by_id.keys() & remove_pairs:
+                for remove_pair in remove_pairs:
+                    lookup_keys_by_id.pop(remove_pair, None)
+                await self.persist_tasks_ids_for_correletable_keys(
+                    lookup_keys=list(lookup_keys_by_id.values()),
+                    cor_instances=cor_instances,
+                )
+
     async def persist_tasks_ids_for_correletable_keys(
         self,
-        lookup_keys: Set[CorreletableKeyTasks],
+        lookup_keys: List[CorreletableLookUpKey],
         cor_instances: List[CorreletableKeyTasks],
     ) -> None:
         """ """
@@ -638,7 +780,7 @@ class Dagger(Service):
         cor_instance = cor_instances[index]
         for chunk in chunks:
             cor_instance = cor_instances[index]
-            cor_instance.lookup_keys = set(chunk)
+            cor_instance.lookup_keys = list(chunk)
             await self._store.set_table_value(
                 self._store.correletable_keys_table, cor_instance.key, cor_instance
             )
@@ -698,14 +840,15 @@ class Dagger(Service):
         :return: Instance of the ITask.
         """
         task = await self._invoke_store_get_value_for_key_with_timer(str(id))
-        if not task:
-            try:
-                raise Exception
-            except Exception:
-                if log:
-                    logger.warning(
-                        f"Task with id: {str(id)} was not found in the kv-table. Returning None instead. {traceback.format_stack()}"
-                    )
+        if not task and log:
+            # logging still captures the stack eagerly once the WARNING level
+            # check passes; the win over the old try/raise/format_stack dance
+            # is skipping the exception machinery and the manual formatting
+            logger.warning(
+                "Task with id: %s was not found in the kv-table. Returning None instead.",
+                id,
+                stack_info=True,
+            )
         return task
 
     def get_db_options(self) -> Mapping[str, Any]:
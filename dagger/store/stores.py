@@ -5,7 +5,7 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any, AsyncGenerator, Mapping, Set
+from typing import Any, AsyncGenerator, List, Mapping, Set
 
 import aerospike  # type: ignore
 import faust.serializers.schemas  # type: ignore
@@ -154,6 +154,19 @@ class IStore:
             if trigger:
                 await self.remove_trigger(trigger)
 
+    async def process_trigger_task_complete_bulk(
+        self, tasks: List[TriggerTask], wokflow_instance: ITemplateDAGInstance
+    ) -> None:
+        """Removes the triggers for a batch of completed trigger tasks in one pass.
+
+        :param tasks: the completed trigger tasks
+        :param wokflow_instance: the workflow instance the tasks belong to
+        """
+        for task in tasks:
+            await self.process_trigger_task_complete(
+                task=task, wokflow_instance=wokflow_instance
+            )
+
     async def execute_system_timer_task(self) -> None:  # pragma: no cover
         async for trigger in self.get_valid_triggers():
             # get all tasks with this trigger
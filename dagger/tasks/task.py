@@ -5,12 +5,27 @@ import asyncio
 import logging
 import random
 import time
-import traceback
 import uuid
+from collections import deque
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, Set, Tuple, Type, TypeVar
+from typing import (
+    Any,
+    Collection,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 from uuid import UUID
 
+from cachetools import LRUCache
 from faust import App, Record, Topic
 from mode import Service
 
@@ -25,6 +40,80 @@ T = TypeVar("T")
 
 TaskLookupKey = Tuple[KT, VT]
 COMPLETE_BY_KEY = "complete_by_time"  # time in seconds
+CLEANUP_YIELD_FREQUENCY = 64  # yield to the event loop every N tasks in cleanup loops
+
+
+def _get_app():
+    """Return the running Dagger application.
+
+    Hot paths bind this once at function entry instead of dereferencing the
+    dagger.service.services.Dagger.app chain on every use
+    """
+    return dagger.service.services.Dagger.app
+
+
+_EVENT_NOW: ContextVar[Optional[int]] = ContextVar("dagger_event_now", default=None)
+"""Wall-clock second captured once per consumed batch by the listener agent."""
+
+
+def _event_now() -> int:
+    """Return the current wall-clock time in whole seconds.
+
+    Task transitions fired while processing a batch of events reuse the
+    timestamp captured at the start of the batch instead of issuing one
+    time.time() syscall per transition
+    :return: the current time in seconds since the epoch
+    """
+    now = _EVENT_NOW.get()
+    return now if now is not None else int(time.time())
+
+
+_DIRTY_WORKFLOWS: ContextVar[Optional[Dict[UUID, Any]]] = ContextVar(
+    "dagger_dirty_workflows", default=None
+)
+"""Workflow instances mutated while processing a batch, keyed by workflow id.
+Flushed once per batch by the listener agent."""
+
+_WORKFLOW_LOCKS: ContextVar[Optional[Dict[UUID, asyncio.Lock]]] = ContextVar(
+    "dagger_workflow_locks", default=None
+)
+"""Per-workflow locks shared by the event groups of one consumed batch."""
+
+
+def _workflow_lock(workflow_instance) -> asyncio.Lock:
+    """Return the batch-scoped lock serializing work on one workflow.
+
+    Two concurrently processed event groups can resolve to the same live
+    workflow instance (one workflow may hold several sensor tasks, and
+    on_message can re-key a sensor mid-batch); the lock keeps their
+    on_message/on_complete chains from interleaving. Outside of batch
+    processing a fresh lock is returned since nothing runs concurrently
+    :param workflow_instance: the workflow instance being processed
+    :return: the lock guarding that workflow for the current batch
+    """
+    locks = _WORKFLOW_LOCKS.get()
+    if locks is None or workflow_instance is None:
+        return asyncio.Lock()
+    lock = locks.get(workflow_instance.id)
+    if lock is None:
+        lock = locks[workflow_instance.id] = asyncio.Lock()
+    return lock
+
+
+async def _update_or_defer_instance(workflow_instance) -> None:
+    """Persist a mutated workflow instance, deferring the write to the end of
+    the current batch when one is active.
+
+    Many transitions inside one consumed batch touch the same workflow; the
+    write-behind set collapses those into a single table write per distinct
+    workflow. Outside of batch processing the write happens immediately
+    :param workflow_instance: the workflow instance to persist
+    """
+    dirty = _DIRTY_WORKFLOWS.get()
+    if dirty is None:
+        await _get_app()._update_instance(task=workflow_instance)
+    elif workflow_instance is not None:
+        dirty[workflow_instance.id] = workflow_instance
 
 
 class TaskStatusEnum(Enum):
@@ -48,12 +137,49 @@ class TaskStatusEnum(Enum):
     """The Task execution was STOPPED"""
 
 
-TERMINAL_STATUSES = [
-    TaskStatusEnum.COMPLETED.name,
-    TaskStatusEnum.SKIPPED.name,
-    TaskStatusEnum.FAILURE.name,
-    TaskStatusEnum.STOPPED.name,
-]
+# status names cached at module scope; every .name access goes through
+# EnumMeta descriptors, which adds up on the event dispatch hot path
+_ST_NOT_STARTED = TaskStatusEnum.NOT_STARTED.name
+_ST_EXECUTING = TaskStatusEnum.EXECUTING.name
+_ST_COMPLETED = TaskStatusEnum.COMPLETED.name
+_ST_FAILURE = TaskStatusEnum.FAILURE.name
+_ST_SKIPPED = TaskStatusEnum.SKIPPED.name
+_ST_SUBMITTED = TaskStatusEnum.SUBMITTED.name
+_ST_STOPPED = TaskStatusEnum.STOPPED.name
+
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {
+        _ST_COMPLETED,
+        _ST_SKIPPED,
+        _ST_FAILURE,
+        _ST_STOPPED,
+    }
+)
+NON_TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {
+        _ST_NOT_STARTED,
+        _ST_EXECUTING,
+    }
+)
+PRE_COMPLETE_STATUSES: frozenset[str] = frozenset(
+    {
+        _ST_COMPLETED,
+        _ST_SKIPPED,
+    }
+)
+MONITORED_TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {
+        _ST_COMPLETED,
+        _ST_SKIPPED,
+        _ST_FAILURE,
+    }
+)
+STARTABLE_STATUSES: frozenset[str] = frozenset(
+    {
+        _ST_NOT_STARTED,
+        _ST_SUBMITTED,
+    }
+)
 
 
 class TaskType(Enum):
@@ -77,6 +203,66 @@ class TaskStatus(Record, serializer="raw"):  # type: ignore
     code: str = TaskStatusEnum.NOT_STARTED.name
     value: str = TaskStatusEnum.NOT_STARTED.value
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                f"Cannot modify shared TaskStatus instance for {self.code}"
+            )
+        super().__setattr__(name, value)
+
+
+_STATUS_SINGLETONS: Dict[TaskStatusEnum, TaskStatus] = {}
+for _status_enum in TaskStatusEnum:
+    _status_singleton = TaskStatus(code=_status_enum.name, value=_status_enum.value)
+    _status_singleton._frozen = True
+    _STATUS_SINGLETONS[_status_enum] = _status_singleton
+
+
+def status_of(status_enum: TaskStatusEnum) -> TaskStatus:
+    """Get the shared immutable TaskStatus instance for a TaskStatusEnum.
+
+    :param status_enum: the status to look up
+    :return: the shared TaskStatus instance
+    """
+    return _STATUS_SINGLETONS[status_enum]
+
+
+_completion_events: Dict[UUID, asyncio.Event] = {}
+"""In-process completion events keyed by task id. Tasks are rehydrated Records
+so the events cannot live on the task instances themselves."""
+
+
+def completion_event_for(task_id: UUID) -> asyncio.Event:
+    """Get (lazily creating) the in-process completion event for a task.
+
+    :param task_id: the id of the task to wait on
+    :return: the asyncio.Event set when the task completes on this worker
+    """
+    event = _completion_events.get(task_id)
+    if event is None:
+        event = asyncio.Event()
+        _completion_events[task_id] = event
+    return event
+
+
+def signal_task_complete(task_id: UUID) -> None:
+    """Wake up any in-process waiters on the task's completion event.
+
+    :param task_id: the id of the task that reached a terminal status
+    """
+    event = _completion_events.pop(task_id, None)
+    if event is not None:
+        event.set()
+
+
+_DEFAULT_NEXT_DAGS: List[UUID] = list()
+"""Shared sentinel for the class-body next_dags default; replaced with a fresh
+list per instance in ITask.__post_init__."""
+
+_DEFAULT_STATUS = TaskStatus()
+"""Shared sentinel for the class-body status default; replaced with a fresh
+TaskStatus per instance in ITask.__post_init__."""
+
 
 class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
     """Class that every template, process, and task extends. Defines attributes and core functions that Dagger uses."""
@@ -84,19 +270,28 @@ class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
     id: UUID
     time_submitted: int = 0
     time_completed: int = 0
-    lastupdated: int = int(time.time())
+    lastupdated: int = 0
     task_name: Optional[str] = None
     task_type: str = TaskType.LEAF.name
     parent_id: Optional[UUID] = None
-    status: TaskStatus = TaskStatus()
-    time_created: int = int(time.time())
-    next_dags: List[UUID] = list()
+    status: TaskStatus = _DEFAULT_STATUS
+    time_created: int = 0
+    next_dags: List[UUID] = _DEFAULT_NEXT_DAGS
     root_dag: Optional[UUID] = None
     message: Optional[str] = None
     allow_skip_to: bool = False
     reprocess_on_message: bool = False
     correlatable_key: Optional[KT] = None
 
+    def __post_init__(self) -> None:
+        # class-body defaults are evaluated once and shared by every instance
+        # that does not override them; hand each task its own mutable state so
+        # an append or status write on one task cannot leak into all the others
+        if self.next_dags is _DEFAULT_NEXT_DAGS:
+            self.next_dags = []
+        if self.status is _DEFAULT_STATUS:
+            self.status = TaskStatus()
+
     def get_id(self) -> UUID:
         return self.id
 
@@ -133,15 +328,23 @@ class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
         ...
 
     async def notify(
-        self, status: TaskStatus, workflow_instance: Optional[ITemplateDAGInstance]
+        self,
+        status: TaskStatus,
+        workflow_instance: Optional[ITemplateDAGInstance],
+        completed_child_id: Optional[UUID] = None,
     ) -> None:  # pragma: no cover
         """If not completed, runs the steps required for completion by calling on_complete().
         This is used to signal a task that it can now complete
         :param status: the status of the task to set to when completed
         :param workflow_instance: the Workflow object
+        :param completed_child_id: the id of the child task that reached a
+            terminal status, when the notification comes from a child
         """
-        if self.status.code != status.code:
-            await self.on_complete(status=status, workflow_instance=workflow_instance)
+        if self.status.code == status.code:
+            # repeated completion signals on an already terminal task are a
+            # no-op; bail before setting up the on_complete await chain
+            return
+        await self.on_complete(status=status, workflow_instance=workflow_instance)
 
     @abc.abstractmethod
     def get_correlatable_key(self, payload: Any) -> TaskLookupKey:  # pragma: no cover
@@ -183,61 +386,79 @@ class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
         """
         ...
 
-    async def get_remaining_tasks(
+    async def get_remaining_tasks(  # noqa: C901
         self,
         next_dag_id: UUID,
         workflow_instance: ITemplateDAGInstance,
         tasks: Optional[List[ITask]] = None,
         end_task_id: UUID = None,
+        visited: Optional[Set[UUID]] = None,
     ) -> Optional[List[ITask]]:
         """Get the remaining tasks in the workflow.
 
+        The traversal is iterative and tracks visited task ids so tasks shared
+        between branches (diamond shaped DAGs) are looked up and appended only
+        once.
+
         :param next_dag_id: Current ITask id.
         :param tasks: List of previous ITasks. Defaults to [].
         :param end_task_id: The task id that the function should stop and return at. Defaults to None (so end of DAG).
         :param workflow_instance: The Workflow object
+        :param visited: Task ids already traversed. Defaults to a fresh set.
         :return: List of remaining ITasks appended to inputted list.
         """
-        if next_dag_id == workflow_instance.id:
-            task_instance = workflow_instance
-        else:
-            task_instance = workflow_instance.get_task(id=next_dag_id)  # type: ignore
-        if not task_instance:
-            logger.warning(
-                f"Could not delete instance of itask with id: '{next_dag_id}' as it does not exist. Skipping."
-            )
-            return tasks
-        if task_instance.root_dag:
-            await self.get_remaining_tasks(
-                task_instance.root_dag, workflow_instance, tasks, end_task_id
-            )
-        if tasks and task_instance.get_id() == end_task_id:
-            tasks.append(task_instance)
-            return tasks
-        if tasks and tasks[-1].get_id() == end_task_id:
-            return tasks
-        elif tasks is not None:
-            tasks.append(task_instance)
-            for next_dag_id in task_instance.next_dags:
-                await self.get_remaining_tasks(
-                    next_dag_id, workflow_instance, tasks, end_task_id
+        if tasks is None:
+            tasks = []
+        if visited is None:
+            visited = set()
+        tasks_by_id = workflow_instance.tasks
+        stack: Deque[UUID] = deque([next_dag_id])
+        while stack:
+            task_id = stack.pop()
+            if task_id in visited:
+                continue
+            task_instance: Optional[ITask]
+            if task_id == workflow_instance.id:
+                task_instance = workflow_instance
+            else:
+                task_instance = tasks_by_id.get(task_id)
+            if not task_instance:
+                logger.warning(
+                    f"Could not delete instance of itask with id: '{task_id}' as it does not exist. Skipping."
                 )
+                visited.add(task_id)
+                continue
+            if task_instance.root_dag and task_instance.root_dag not in visited:
+                # traverse the task's own root dag before the task itself
+                stack.append(task_id)
+                stack.append(task_instance.root_dag)
+                continue
+            visited.add(task_id)
+            tasks.append(task_instance)
+            if task_instance.get_id() == end_task_id:
+                return tasks
+            for child_id in reversed(task_instance.next_dags):
+                if child_id not in visited:
+                    stack.append(child_id)
         return tasks
 
     async def on_complete(  # noqa: C901
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         *,
         iterate: bool = True,
     ) -> None:
         """Sets the status of the ITask to completed and starts the next ITask if there is one.
+
+        Callable with a status the task already has (notify pre-checks and
+        skips that case); the status write and instance update are then
+        skipped but the DAG still iterates to the next task.
         :param workflow_instance: The workflow object
         :param status: The status of the task to set to
         """
         # get the parent
+        app = _get_app()
         if self.status.code != status.code:
             self.status = status
             if self.time_completed > 0:
@@ -245,34 +466,35 @@ class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
                     self.time_completed
                 )  # if time_completed is set by the application honor that
             else:
-                time_completed = int(time.time())
+                time_completed = _event_now()
             self.time_completed = time_completed
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
+            signal_task_complete(self.id)
+            await _update_or_defer_instance(workflow_instance)
         if not iterate:
             logger.debug("Skipping on_complete as iterate is false")
             return
         next_task_submitted = False
-        for next_dag_id in self.next_dags:
-            await asyncio.sleep(0)
-            next_dag_instance = workflow_instance.get_task(id=next_dag_id)  # type: ignore
-            if not next_dag_instance:
-                logger.error(
-                    f"Could not find the next DAG in the template with id: {next_dag_id} and thus unable to set to complete. Skipping."
-                )
-                continue
-            next_task_submitted = True
-            if next_dag_instance.status.code == TaskStatusEnum.SKIPPED.name:
-                logger.info(f"Skipping skipped task {next_dag_instance} {next_dag_id}")
-            else:
-                return await next_dag_instance.start(
-                    workflow_instance=workflow_instance
-                )
+        if self.next_dags and workflow_instance:
+            for next_dag_instance in workflow_instance.get_next_dag_instances(  # type: ignore
+                task_id=self.id, next_dags=self.next_dags
+            ):
+                next_task_submitted = True
+                if next_dag_instance.status.code == _ST_SKIPPED:
+                    logger.info(
+                        f"Skipping skipped task {next_dag_instance} {next_dag_instance.id}"
+                    )
+                else:
+                    return await next_dag_instance.start(
+                        workflow_instance=workflow_instance
+                    )
         if next_task_submitted is False and self.parent_id and workflow_instance:
             parent_node = workflow_instance.get_task(id=self.parent_id)
             if parent_node:
                 parent_node.time_completed = self.time_completed
                 await parent_node.notify(
-                    status=status, workflow_instance=workflow_instance
+                    status=status,
+                    workflow_instance=workflow_instance,
+                    completed_child_id=self.id,
                 )
             else:
                 logger.error(
@@ -281,25 +503,45 @@ class ITask(Record, Generic[KT, VT], serializer="raw"):  # type: ignore
         elif self.task_type == TaskType.ROOT.name and workflow_instance:
             subdags_in_non_terminating_state = False
             logger.debug(f"Executing root dag cleanup {str(workflow_instance.id)}")
+            correlatable_removals: List[ITask] = []
+            monitor_completions: List[ITask] = []
+            tasks_processed = 0
             for task in workflow_instance.tasks.values():
-                await asyncio.sleep(0)
-                if task and task.status.code not in [
-                    TaskStatusEnum.COMPLETED.name,
-                    TaskStatusEnum.SKIPPED.name,
-                    TaskStatusEnum.FAILURE.name,
-                    TaskStatusEnum.STOPPED.name,
-                ]:
+                tasks_processed += 1
+                if tasks_processed % CLEANUP_YIELD_FREQUENCY == 0:
+                    # yield to the event loop periodically instead of on every task
+                    await asyncio.sleep(0)
+                if task and task.status.code not in TERMINAL_STATUSES:
                     subdags_in_non_terminating_state = True
-
-                await dagger.service.services.Dagger.app.remove_task_from_correletable_keys_table(task, workflow_instance=workflow_instance)  # type: ignore
-                m_task = await dagger.service.services.Dagger.app.get_monitoring_task(task=task, workflow_instance=workflow_instance)  # type: ignore
+                correlatable_removals.append(task)
+                m_task = await app.get_monitoring_task(task=task, workflow_instance=workflow_instance)  # type: ignore
                 if m_task:
-                    await m_task.on_complete(workflow_instance=workflow_instance)
-                    await dagger.service.services.Dagger.app._store.process_trigger_task_complete(  # type: ignore
-                        m_task, wokflow_instance=workflow_instance
-                    )  # type: ignore
-            if dagger.service.services.Dagger.app.delete_workflow_on_complete:  # type: ignore
-                await dagger.service.services.Dagger.app._remove_root_template_instance(self)  # type: ignore
+                    monitor_completions.append(m_task)
+            flushes = []
+            if correlatable_removals:
+                flushes.append(
+                    app.remove_tasks_from_correletable_keys_table_bulk(  # type: ignore
+                        correlatable_removals, workflow_instance=workflow_instance
+                    )
+                )
+            if monitor_completions:
+                monitor_time_completed = _event_now()
+                for m_task in monitor_completions:
+                    if m_task.status.code != _ST_COMPLETED:
+                        m_task.status = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED]
+                        m_task.time_completed = monitor_time_completed
+                flushes.append(
+                    app._store.process_trigger_task_complete_bulk(  # type: ignore
+                        monitor_completions, wokflow_instance=workflow_instance
+                    )
+                )
+                flushes.append(_update_or_defer_instance(workflow_instance))
+            if flushes:
+                # the removals, trigger completions and the workflow write hit
+                # independent tables, so flush them concurrently
+                await asyncio.gather(*flushes)
+            if app.delete_workflow_on_complete:  # type: ignore
+                await app._remove_root_template_instance(self)  # type: ignore
                 logger.info(f"Removed references to root task: {self.id}")
             if subdags_in_non_terminating_state and workflow_instance:
                 logger.info(
@@ -317,26 +559,20 @@ class ExecutorTask(ITask[KT, VT], abc.ABC):
         ignore_status: bool = False,
     ) -> None:
         # pre-execute
-        if self.status.code in [
-            TaskStatusEnum.COMPLETED.name,
-            TaskStatusEnum.SKIPPED.name,
-        ]:
+        status = self.status
+        if status.code in PRE_COMPLETE_STATUSES:
             return await self.on_complete(
-                status=self.status, workflow_instance=workflow_instance
+                status=status, workflow_instance=workflow_instance
             )
-        if (
-            ignore_status or self.status.code == TaskStatusEnum.NOT_STARTED.name
-        ) and workflow_instance:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
+        if (ignore_status or status.code == _ST_NOT_STARTED) and workflow_instance:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = _event_now()
             await self.execute(
                 runtime_parameters=workflow_instance.runtime_parameters,
                 workflow_instance=workflow_instance,
             )
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
-        if self.status.code == TaskStatusEnum.FAILURE.name:
+            await _update_or_defer_instance(workflow_instance)
+        if self.status.code == _ST_FAILURE:
             await self.on_complete(
                 status=self.status, workflow_instance=workflow_instance
             )
@@ -371,31 +607,27 @@ class TriggerTask(ExecutorTask[KT, VT], abc.ABC):
     async def start(
         self, workflow_instance: Optional[ITemplateDAGInstance], ignore_status=True
     ) -> None:
-        await asyncio.sleep(0)
-        if self.status.code == TaskStatusEnum.NOT_STARTED.name:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
-        if not self.time_to_execute or int(time.time()) >= self.time_to_execute:
+        now = int(time.time())
+        if self.status.code == _ST_NOT_STARTED:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = now
+        if not self.time_to_execute or now >= self.time_to_execute:
             logger.info(
                 f"Trigger task {self.id} triggered for trigger time {self.time_to_execute} "
             )
             await super().start(workflow_instance=workflow_instance, ignore_status=True)
         else:
             logger.warning(
-                f"Trigger task {self.id} {time.time()} cannot be triggered for trigger time {self.time_to_execute}"
+                f"Trigger task {self.id} {now} cannot be triggered for trigger time {self.time_to_execute}"
             )
 
     async def on_complete(
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         iterate=True,
     ) -> None:
-        await dagger.service.services.Dagger.app._store.process_trigger_task_complete(self, wokflow_instance=workflow_instance)  # type: ignore
+        await _get_app()._store.process_trigger_task_complete(self, wokflow_instance=workflow_instance)  # type: ignore
         await super().on_complete(workflow_instance=workflow_instance, iterate=iterate)
 
 
@@ -410,16 +642,16 @@ class IntervalTask(TriggerTask[KT, VT], abc.ABC):
 
     async def start(self, workflow_instance: Optional[ITemplateDAGInstance]) -> bool:  # type: ignore
         is_finished = False
-        if self.status.code == TaskStatusEnum.NOT_STARTED.name:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
-        if self.time_to_execute and int(time.time()) < self.time_to_execute:
+        now = int(time.time())
+        app = _get_app()
+        if self.status.code == _ST_NOT_STARTED:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = now
+            await _update_or_defer_instance(workflow_instance)
+        if self.time_to_execute and now < self.time_to_execute:
             return False
         if (
-            not self.time_to_execute or int(time.time()) >= self.time_to_execute
+            not self.time_to_execute or now >= self.time_to_execute
         ) and workflow_instance:
             logger.info(
                 f"Interval task {self.id} executed on interval of {self.interval_execute_period} "
@@ -427,13 +659,15 @@ class IntervalTask(TriggerTask[KT, VT], abc.ABC):
             is_finished = await self.interval_execute(
                 workflow_instance.runtime_parameters
             )
+            # refresh after the interval_execute await so the next interval is
+            # anchored to when the execution actually finished
+            now = int(time.time())
             if not is_finished and self.interval_execute_period:
-                self.time_to_execute = int(time.time()) + self.interval_execute_period
-                await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
-                await dagger.service.services.Dagger.app._store_trigger_instance(self, workflow_instance=workflow_instance)  # type: ignore
+                self.time_to_execute = now + self.interval_execute_period
+                await _update_or_defer_instance(workflow_instance)
+                await app._store_trigger_instance(self, workflow_instance=workflow_instance)  # type: ignore
         if is_finished or (
-            self.time_to_force_complete
-            and int(time.time()) >= self.time_to_force_complete
+            self.time_to_force_complete and now >= self.time_to_force_complete
         ):
             await super().start(
                 ignore_status=False, workflow_instance=workflow_instance
@@ -469,12 +703,56 @@ class MonitoringTask(TriggerTask[KT, VT], abc.ABC):
         """
         ...
 
+    async def wait_for_monitored_task(
+        self, workflow_instance: Optional[ITemplateDAGInstance]
+    ) -> None:
+        """Wait on the monitored task's completion event instead of polling.
+
+        Returns as soon as the monitored task completes on this worker. If the
+        deadline passes first, the monitoring logic in execute runs. The stored
+        trigger remains the durable fallback across restarts
+        :param workflow_instance: the workflow object
+        """
+        if self.monitored_task_id is None or self.time_to_execute is None:
+            return
+        # the waiter is scheduled from batch processing and inherits a copy of
+        # the batch context; clear the batch-scoped vars so the skip path that
+        # runs at the deadline writes through immediately with the real time,
+        # and drop the lock map so the batch's locks are not pinned for the
+        # lifetime of the waiter
+        _EVENT_NOW.set(None)
+        _DIRTY_WORKFLOWS.set(None)
+        _WORKFLOW_LOCKS.set(None)
+        delay = self.time_to_execute - int(time.time())
+        event = completion_event_for(self.monitored_task_id)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(delay, 0))
+        except asyncio.TimeoutError:
+            _completion_events.pop(self.monitored_task_id, None)
+            runtime_parameters = (
+                workflow_instance.runtime_parameters if workflow_instance else {}
+            )
+            await self.execute(
+                runtime_parameters=runtime_parameters,
+                workflow_instance=workflow_instance,
+            )
+
+    def schedule_wait_for_monitored_task(
+        self, workflow_instance: Optional[ITemplateDAGInstance]
+    ) -> None:
+        """Schedule the completion-event waiter if an event loop is running.
+        :param workflow_instance: the workflow object
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.create_task(self.wait_for_monitored_task(workflow_instance))
+
     async def on_complete(
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         iterate=True,
     ) -> None:
         await super().on_complete(
@@ -496,12 +774,11 @@ class DefaultMonitoringTask(MonitoringTask[str, str]):
             f"Executing DefaultMonitoringTask {self.id} monitoring for {self.monitored_task_id}"
         )
         # check the status of the monitored task
-        monitored_task = workflow_instance.get_task(id=self.monitored_task_id)  # type: ignore
-        if monitored_task and monitored_task.status.code not in [
-            TaskStatusEnum.COMPLETED.name,
-            TaskStatusEnum.SKIPPED.name,
-            TaskStatusEnum.FAILURE.name,
-        ]:
+        monitored_task = workflow_instance.tasks.get(self.monitored_task_id)  # type: ignore
+        if (
+            monitored_task
+            and monitored_task.status.code not in MONITORED_TERMINAL_STATUSES
+        ):
             logger.info(f"Processing the monitored task {self.monitored_task_id}")
             await self.process_monitored_task(
                 monitored_task=monitored_task, workflow_instance=workflow_instance
@@ -512,7 +789,7 @@ class SkipOnMaxDurationTask(DefaultMonitoringTask):
     async def process_monitored_task(
         self, monitored_task: ITask, workflow_instance: Optional[ITemplateDAGInstance]
     ) -> None:  # pragma: no cover
-        if monitored_task.status.code == TaskStatusEnum.EXECUTING.name:
+        if monitored_task.status.code == _ST_EXECUTING:
             if monitored_task and workflow_instance:
                 logger.info(
                     f"Process: {monitored_task.process_name} with id: {monitored_task.id} did not finish before it's timeout. Skipping."
@@ -524,15 +801,10 @@ class SkipOnMaxDurationTask(DefaultMonitoringTask):
                     [],
                     end_task_id=monitored_task.get_id(),
                 )
-                skipped_task_status = TaskStatus(
-                    code=TaskStatusEnum.SKIPPED.name, value=TaskStatusEnum.SKIPPED.value
-                )
+                skipped_task_status = _STATUS_SINGLETONS[TaskStatusEnum.SKIPPED]
                 if all_prev_dags:
                     for dag in all_prev_dags[:-1]:
-                        if dag.status.code in [
-                            TaskStatusEnum.EXECUTING.value,
-                            TaskStatusEnum.NOT_STARTED.value,
-                        ]:
+                        if dag.status.code in NON_TERMINAL_STATUSES:
                             await dag.on_complete(
                                 status=skipped_task_status,
                                 workflow_instance=workflow_instance,
@@ -543,40 +815,71 @@ class SkipOnMaxDurationTask(DefaultMonitoringTask):
                 )
 
 
+_decision_results: LRUCache = LRUCache(maxsize=1024)
+"""Per-process memo of DecisionTask branch choices, keyed on
+(task_name, sorted runtime parameters) and storing the index into
+next_dags (the task ids themselves are workflow-local)."""
+
+
 class DecisionTask(ITask[KT, VT]):
     """
     This type of task is similar to the `case..switch` statement in a programming language. It returns the next task to
     execute based on the execution logic. A decision task needs to implement
     """
 
+    memoize_evaluation: bool = False
+    """Opt-in: cache the branch chosen by evaluate for identical runtime
+    parameters. Only enable when evaluate is deterministic in its inputs."""
+
+    async def _evaluate_memoized(
+        self, workflow_instance: ITemplateDAGInstance
+    ) -> Optional[UUID]:
+        """Evaluate the decision, reusing a cached branch choice when enabled.
+
+        The cache stores the index of the chosen branch in next_dags so the
+        memo is shared across workflow instances of the same template
+        :param workflow_instance: The workflow object
+        :return: The next ITask id
+        """
+        runtime_parameters = workflow_instance.runtime_parameters
+        if not self.memoize_evaluation:
+            return await self.evaluate(**runtime_parameters)
+        try:
+            cache_key = (self.task_name, tuple(sorted(runtime_parameters.items())))
+            cached_index = _decision_results.get(cache_key)
+        except TypeError:
+            # unhashable or unorderable runtime parameters cannot be memoized;
+            # hashing only happens at the cache lookup, so it sits in the try
+            return await self.evaluate(**runtime_parameters)
+        if cached_index is not None and cached_index < len(self.next_dags):
+            return self.next_dags[cached_index]
+        task_to_execute = await self.evaluate(**runtime_parameters)
+        if task_to_execute is not None:
+            try:
+                _decision_results[cache_key] = self.next_dags.index(task_to_execute)
+            except ValueError:
+                pass
+        return task_to_execute
+
     async def start(self, workflow_instance: Optional[ITemplateDAGInstance]) -> None:
         # pre-execute
-        if self.status.code in [
-            TaskStatusEnum.COMPLETED.name,
-            TaskStatusEnum.SKIPPED.name,
-        ]:
+        status_code = self.status.code
+        if status_code in PRE_COMPLETE_STATUSES:
             return await self.on_complete(workflow_instance=workflow_instance)
-        if self.status.code == TaskStatusEnum.NOT_STARTED.name and workflow_instance:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
-            task_to_execute = await self.evaluate(
-                **workflow_instance.runtime_parameters
-            )
+        if status_code == _ST_NOT_STARTED and workflow_instance:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = _event_now()
+            task_to_execute = await self._evaluate_memoized(workflow_instance)
             for next_task_id in self.next_dags:
                 if next_task_id != task_to_execute:
-                    task_to_skip = workflow_instance.get_taskt(id=next_task_id)  # type: ignore
+                    task_to_skip = workflow_instance.tasks.get(next_task_id)
                     if task_to_skip:
-                        task_to_skip.status = TaskStatus(
-                            code=TaskStatusEnum.SKIPPED.name,
-                            value=TaskStatusEnum.SKIPPED.value,
-                        )
+                        task_to_skip.status = _STATUS_SINGLETONS[TaskStatusEnum.SKIPPED]
                     else:
                         logger.warning(
                             f"The task instance to skip with id {next_task_id} was not found. Skipped but did not set status to {TaskStatusEnum.SKIPPED.value}"
                         )
-        await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
+        await _update_or_defer_instance(workflow_instance)
         await self.on_complete(workflow_instance=workflow_instance)
 
     async def execute(
@@ -640,9 +943,7 @@ class SystemTask(ExecutorTask[str, str]):
     async def on_complete(
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         iterate=True,
     ) -> None:
         """Not implemented.
@@ -654,13 +955,9 @@ class SystemTask(ExecutorTask[str, str]):
     async def start(
         self, workflow_instance: Optional[ITemplateDAGInstance], ignore_status=True
     ) -> None:
-        if (
-            ignore_status or self.status.code == TaskStatusEnum.NOT_STARTED.name
-        ) and workflow_instance:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
+        if (ignore_status or self.status.code == _ST_NOT_STARTED) and workflow_instance:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = _event_now()
             await self.execute(
                 runtime_parameters=workflow_instance.runtime_parameters,
                 workflow_instance=workflow_instance,
@@ -675,16 +972,15 @@ class SystemTimerTask(SystemTask):
     async def execute(
         self, runtime_parameters: Dict[str, VT], workflow_instance: ITask = None
     ) -> None:
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         try:
-            await dagger.service.services.Dagger.app._store.execute_system_timer_task()  # type: ignore
-        except Exception as ex:
-            logger.warning(
-                f"Exception in SystemTimerTask execute {ex} {traceback.format_stack()}"
-            )
+            await _get_app()._store.execute_system_timer_task()  # type: ignore
+        except Exception:
+            logger.exception("Exception in SystemTimerTask execute")
 
-        end_time = time.time()
-        logger.info(f"SystemTimerTask.execute took {end_time-start_time}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"SystemTimerTask.execute took {loop.time()-start_time}")
 
 
 class SensorTask(ITask[KT, VT], abc.ABC):
@@ -697,19 +993,15 @@ class SensorTask(ITask[KT, VT], abc.ABC):
 
     async def start(self, workflow_instance: Optional[ITemplateDAGInstance]) -> None:
         # pre-execute
-        if self.status.code in [
-            TaskStatusEnum.COMPLETED.name,
-            TaskStatusEnum.SKIPPED.name,
-        ]:
+        status = self.status
+        if status.code in PRE_COMPLETE_STATUSES:
             return await self.on_complete(
-                status=self.status, workflow_instance=workflow_instance
+                status=status, workflow_instance=workflow_instance
             )
-        if self.status.code == TaskStatusEnum.NOT_STARTED.name:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
+        if status.code == _ST_NOT_STARTED:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = _event_now()
+            await _update_or_defer_instance(workflow_instance)
 
     async def _update_correletable_key(self, workflow_instance: ITask) -> None:
         """Updates the correletable key if the local is not the same as global key.
@@ -720,11 +1012,8 @@ class SensorTask(ITask[KT, VT], abc.ABC):
             global_key = workflow_instance.runtime_parameters.get(
                 self.correlatable_key, None
             )
-            if self.status.code in [
-                TaskStatusEnum.NOT_STARTED.name,
-                TaskStatusEnum.EXECUTING.name,
-            ]:  # type: ignore
-                await dagger.service.services.Dagger.app.update_correletable_key_for_task(  # type: ignore
+            if self.status.code in NON_TERMINAL_STATUSES:  # type: ignore
+                await _get_app().update_correletable_key_for_task(  # type: ignore
                     self, str(global_key), workflow_instance=workflow_instance
                 )  # type: ignore
         else:
@@ -774,6 +1063,13 @@ class IMonitoredTask:
 
 
 class KafkaAgent:
+    __slots__ = ("__topic", "app", "__task")
+
+    BATCH_SIZE = 100
+    """Maximum number of events pulled from the stream per take window."""
+    BATCH_TIMEOUT_SECONDS = 1.0
+    """How long to wait for a batch to fill before processing a partial one."""
+
     __topic: Topic
     __task: KafkaListenerTask
 
@@ -782,31 +1078,81 @@ class KafkaAgent:
         self.app = app
         self.__task = task
 
-    async def process_event_helper(self, event):  # noqa: C901
-        start_time = self.app.faust_app.loop.time()
-        mappings = await self.__task.get_correlatable_keys_from_payload(event)
+    @staticmethod
+    def _correlatable_attr_values(
+        workflow_instance: ITemplateDAGInstance,
+    ) -> Dict[str, Any]:
+        """Snapshot the runtime parameters bound to sensor tasks before
+        on_message mutates them.
+
+        :param workflow_instance: the workflow instance processing the event
+        :return: the current value of every correlatable runtime parameter
+        """
+        runtime_parameters = workflow_instance.runtime_parameters
+        return {
+            attr: runtime_parameters.get(attr)
+            for attr in workflow_instance._attr_to_sensors_index()
+        }
+
+    @staticmethod
+    def _changed_correlatable_keys(
+        workflow_instance: ITemplateDAGInstance, attr_values_before: Dict[str, Any]
+    ) -> Set[str]:
+        """Diff the correlatable runtime parameters against a snapshot taken
+        before on_message.
+
+        :param workflow_instance: the workflow instance processing the event
+        :param attr_values_before: the snapshot taken by _correlatable_attr_values
+        :return: the runtime parameter names whose value changed
+        """
+        runtime_parameters = workflow_instance.runtime_parameters
+        return {
+            attr
+            for attr, value in attr_values_before.items()
+            if runtime_parameters.get(attr) != value
+        }
+
+    async def process_event_helper(self, event, mappings=None):  # noqa: C901
+        app = self.app
+        dd_sensor = getattr(app, "dd_sensor", None)
+        # skip all timing work when no metrics sink is configured
+        start_time = app.faust_app.loop.time() if dd_sensor is not None else 0.0
+        topic_name = self.__topic.get_topic_name()
+        if mappings is None:
+            mappings = await self.__task.get_correlatable_keys_from_payload(event)
         processed_task = False
         if mappings:
+            updated_mappings = []
             for mapping in mappings:
                 if not mapping or len(mapping) < 2:
                     logger.warning(
-                        f"Listener on topic {self.__topic.get_topic_name()} has incorrect mapping {mapping}"
+                        f"Listener on topic {topic_name} has incorrect mapping {mapping}"
                     )
                     continue
-                updated_mapping = (
-                    mapping[0],
-                    f"{mapping[1]}_{self.__topic.get_topic_name()}",
+                updated_mappings.append(
+                    (
+                        mapping[0],
+                        f"{mapping[1]}_{topic_name}",
+                    )
                 )
-                async for workflow_instance, task_instance in self.app._get_tasks_by_correlatable_key(
-                    updated_mapping, get_completed=True
+            if updated_mappings:
+                # constant for the lifetime of the listener definition; read
+                # once per event instead of once per matched task
+                match_only_one = getattr(self.__task, "match_only_one", False)
+                async for workflow_instance, task_instance in app._get_tasks_by_correlatable_keys_bulk(
+                    updated_mappings, get_completed=True
                 ):
                     try:
-                        if task_instance and task_instance.topic:
-                            if task_instance.topic == self.__topic.get_topic_name():
+                        if task_instance and task_instance.topic == topic_name:
+                            # one workflow can be resolved by several groups
+                            # of the batch; serialize work on it
+                            async with _workflow_lock(workflow_instance):
+                                # status.code is read once and tracked locally
+                                # through the dispatch ladder below
+                                status_code = task_instance.status.code
                                 # Skip previous tasks if received task was in not started status.
                                 if (
-                                    task_instance.status.code
-                                    == TaskStatusEnum.NOT_STARTED.name
+                                    status_code == _ST_NOT_STARTED
                                     and task_instance.allow_skip_to  # noqa: W503
                                 ):
                                     logger.debug(
@@ -823,71 +1169,74 @@ class KafkaAgent:
                                             end_task_id=task_instance.get_id(),
                                         )
                                     )
-                                    task_instance.status = TaskStatus(
-                                        code=TaskStatusEnum.EXECUTING.name,
-                                        value=TaskStatusEnum.EXECUTING.value,
-                                    )
-                                    task_instance.time_submitted = int(time.time())
+                                    task_instance.status = _STATUS_SINGLETONS[
+                                        TaskStatusEnum.EXECUTING
+                                    ]
+                                    status_code = _ST_EXECUTING
+                                    task_instance.time_submitted = _event_now()
                                     processed_task = True
                                     for task in previous_tasks[:-1]:
-                                        if task.status.code in [
-                                            TaskStatusEnum.NOT_STARTED.name,
-                                            TaskStatusEnum.EXECUTING.name,
-                                        ]:
+                                        if task.status.code in NON_TERMINAL_STATUSES:
                                             logger.debug(f"Skipped task {task} {event}")
                                             await task.on_complete(
                                                 workflow_instance=workflow_instance,
-                                                status=TaskStatus(
-                                                    code=TaskStatusEnum.SKIPPED.name,
-                                                    value=TaskStatusEnum.SKIPPED.value,
-                                                ),
+                                                status=_STATUS_SINGLETONS[
+                                                    TaskStatusEnum.SKIPPED
+                                                ],
                                                 iterate=False,
                                             )
 
-                                if (
-                                    task_instance.status.code
-                                    == TaskStatusEnum.COMPLETED.name
-                                ):
-                                    if (
-                                        hasattr(task_instance, "reprocess_on_message")
-                                        and task_instance.reprocess_on_message
-                                    ):
+                                if status_code == _ST_COMPLETED:
+                                    # reprocess_on_message is a declared ITask
+                                    # field, so no hasattr probe is needed
+                                    if task_instance.reprocess_on_message:
+                                        attr_values_before = (
+                                            self._correlatable_attr_values(
+                                                workflow_instance
+                                            )
+                                        )
                                         await task_instance.on_message(
                                             workflow_instance.runtime_parameters, event
                                         )
-                                        await workflow_instance._update_global_runtime_parameters()
+                                        await workflow_instance._update_global_runtime_parameters(
+                                            changed_keys=self._changed_correlatable_keys(
+                                                workflow_instance, attr_values_before
+                                            )
+                                        )
                                     else:
                                         await task_instance.start(workflow_instance)
                                     processed_task = True
                                     continue
 
                                 # Process on_message for task only if executing or skipped but set to allow out of order processing
-                                elif (
-                                    task_instance.status.code
-                                    != TaskStatusEnum.EXECUTING.name
-                                    and (
-                                        task_instance.status.code
-                                        != TaskStatusEnum.SKIPPED.name
-                                        or not task_instance.allow_skip_to  # noqa: W503
-                                    )
+                                elif status_code != _ST_EXECUTING and (
+                                    status_code != _ST_SKIPPED
+                                    or not task_instance.allow_skip_to  # noqa: W503
                                 ):
                                     logger.info(
                                         f"Received event for task {task_instance} however the task was not in an executing state nor was it in a skipped state with out of order processing enabled. Not processing on_message for this task. Event: {event}"
                                     )
                                     continue
+                                attr_values_before = self._correlatable_attr_values(
+                                    workflow_instance
+                                )
                                 completed = await task_instance.on_message(
                                     workflow_instance.runtime_parameters, event
                                 )
-                                await workflow_instance._update_global_runtime_parameters()
+                                await workflow_instance._update_global_runtime_parameters(
+                                    changed_keys=self._changed_correlatable_keys(
+                                        workflow_instance, attr_values_before
+                                    )
+                                )
                                 if completed:
                                     await task_instance.on_complete(
                                         workflow_instance=workflow_instance
                                     )
                                 processed_task = True
 
-                                if getattr(self.__task, "match_only_one", False):
+                                if match_only_one:
                                     logger.info(
-                                        f"Matched exactly once on input topic {self.__topic.get_topic_name()}"
+                                        f"Matched exactly once on input topic {topic_name}"
                                     )
                                     break
                     except Exception as ex:
@@ -899,15 +1248,133 @@ class KafkaAgent:
             logger.debug(
                 f"listener agent on topic: {self.__topic} found no tasks for mapping"
             )
-        end_time = dagger.service.services.Dagger.app.faust_app.loop.time() - start_time  # type: ignore
-        if processed_task and getattr(dagger.service.services.Dagger.app, "dd_sensor", None):  # type: ignore
-            dagger.service.services.Dagger.app.dd_sensor.client.histogram(  # type: ignore
-                metric="process_event_helper", value=end_time
+        if processed_task and dd_sensor is not None:
+            dd_sensor.client.histogram(  # type: ignore
+                metric="process_event_helper",
+                value=app.faust_app.loop.time() - start_time,
             )  # type: ignore
 
+    @staticmethod
+    def _group_events_by_correlatable_key(
+        event_mappings: List[Tuple[Any, Any]]
+    ) -> List[List[Tuple[Any, Any]]]:
+        """Partition a batch into groups of events whose correlatable key
+        values overlap.
+
+        Events sharing no key value have no ordering dependency between them,
+        so the groups can be processed concurrently while arrival order is
+        preserved inside each group.
+
+        :param event_mappings: the (event, mappings) pairs in arrival order
+        :return: the groups, each holding its events in arrival order
+        """
+        groups: List[Optional[List[Tuple[Any, Any]]]] = []
+        group_by_value: Dict[Any, int] = {}
+        for event, mappings in event_mappings:
+            values = {
+                mapping[1]
+                for mapping in mappings or []
+                if mapping and len(mapping) >= 2
+            }
+            matched = sorted(
+                {group_by_value[value] for value in values if value in group_by_value}
+            )
+            if matched:
+                target = matched[0]
+                for other in matched[1:]:
+                    # merged groups shared no key value until this event, so
+                    # concatenation preserves every per-key ordering
+                    groups[target].extend(groups[other])  # type: ignore
+                    groups[other] = None
+                    for value, group_id in group_by_value.items():
+                        if group_id == other:
+                            group_by_value[value] = target
+            else:
+                target = len(groups)
+                groups.append([])
+            groups[target].append((event, mappings))  # type: ignore
+            for value in values:
+                group_by_value[value] = target
+        return [group for group in groups if group]
+
+    async def _process_event_group(self, group: List[Tuple[Any, Any]]) -> None:
+        """Process one correlatable-key group of a batch in arrival order.
+
+        :param group: the (event, mappings) pairs of the group
+        """
+        for event, mappings in group:
+            # the batch already extracted the mappings; pass [] for a None
+            # extraction so the helper does not re-run the payload parser
+            await self.process_event_helper(
+                event, mappings=mappings if mappings is not None else []
+            )
+
+    async def process_event_batch(self, events) -> None:
+        """Process one bounded batch of consumed events.
+
+        Events are sharded by correlatable key value: groups with disjoint
+        keys run concurrently, while events sharing a key stay in one group
+        and keep their arrival order. Groups that resolve to the same live
+        workflow instance are serialized by a per-workflow lock. Offsets are
+        only committed once the whole batch has been awaited, so delivery
+        semantics are unchanged.
+
+        :param events: the events pulled from the stream in one take window
+        """
+        dd_sensor = getattr(self.app, "dd_sensor", None)
+        batch_start = self.app.faust_app.loop.time() if dd_sensor is not None else 0.0  # type: ignore
+        now_token = _EVENT_NOW.set(int(time.time()))
+        dirty_token = _DIRTY_WORKFLOWS.set({})
+        locks_token = _WORKFLOW_LOCKS.set({})
+        try:
+            event_mappings = [
+                (
+                    event,
+                    await self.__task.get_correlatable_keys_from_payload(event),
+                )
+                for event in events
+            ]
+            groups = self._group_events_by_correlatable_key(event_mappings)
+            if len(groups) == 1:
+                await self._process_event_group(groups[0])
+            elif groups:
+                results = await asyncio.gather(
+                    *(self._process_event_group(group) for group in groups),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            f"Error processing event group on topic {self.__topic}. error {result}",
+                            exc_info=result,
+                        )
+        finally:
+            dirty_workflows = _DIRTY_WORKFLOWS.get()
+            _WORKFLOW_LOCKS.reset(locks_token)
+            _DIRTY_WORKFLOWS.reset(dirty_token)
+            _EVENT_NOW.reset(now_token)
+            if dirty_workflows:
+                # one table write per distinct workflow touched by the batch
+                await asyncio.gather(
+                    *(
+                        self.app._update_instance(task=workflow_instance)  # type: ignore
+                        for workflow_instance in dirty_workflows.values()
+                    )
+                )
+        if dd_sensor is not None:
+            dd_sensor.client.histogram(  # type: ignore
+                metric="process_event_batch_duration",
+                value=self.app.faust_app.loop.time() - batch_start,  # type: ignore
+            )
+            dd_sensor.client.gauge(  # type: ignore
+                metric="process_event_batch_size", value=len(events)
+            )
+
     async def process_event(self, stream):
-        async for event in stream:
-            await self.process_event_helper(event)
+        async for events in stream.take(
+            self.BATCH_SIZE, within=self.BATCH_TIMEOUT_SECONDS
+        ):
+            await self.process_event_batch(events)
 
     def decorate(self, app: App, concurrency: int = 1) -> None:
         app.agent(self.__topic, name=self.__topic.get_topic_name(), concurrency=concurrency)(  # type: ignore
@@ -948,22 +1415,17 @@ class INonLeafNodeTask(ITask[KT, VT], abc.ABC):
         pass
 
     async def start(self, workflow_instance: Optional[ITemplateDAGInstance]) -> None:
-        if self.status.code in [
-            TaskStatusEnum.COMPLETED.name,
-            TaskStatusEnum.SKIPPED.name,
-        ]:
+        status = self.status
+        if status.code in PRE_COMPLETE_STATUSES:
             return await self.on_complete(
-                status=self.status, workflow_instance=workflow_instance
+                status=status, workflow_instance=workflow_instance
             )
-        if (
-            self.status.code == TaskStatusEnum.NOT_STARTED.name
-            or self.status.code == TaskStatusEnum.SUBMITTED.name
-        ) and workflow_instance:
+        if status.code in STARTABLE_STATUSES and workflow_instance:
             await self.execute(
                 runtime_parameters=workflow_instance.runtime_parameters,
                 workflow_instance=workflow_instance,
             )
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
+            await _update_or_defer_instance(workflow_instance)
         logger.debug(
             f"Starting task {self.task_name} with root dag id {self.root_dag}, parent task id {self.parent_id}, and task id {self.id}"
         )
@@ -981,10 +1443,8 @@ class INonLeafNodeTask(ITask[KT, VT], abc.ABC):
         self, runtime_parameters: Dict[str, str], workflow_instance: ITask = None
     ) -> None:
         logger.debug(f"starting execution of {self.id}")
-        self.status = TaskStatus(
-            code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-        )
-        self.time_submitted = int(time.time())
+        self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+        self.time_submitted = _event_now()
 
 
 class TaskOperator(Enum):
@@ -1002,6 +1462,11 @@ class TaskOperator(Enum):
     """
 
 
+_DEFAULT_PARALLEL_CHILDREN: Set[UUID] = set()
+"""Shared sentinel for the class-body parallel_child_task_list default;
+replaced with a fresh set per instance in ParallelCompositeTask.__post_init__."""
+
+
 class ParallelCompositeTask(ITask[KT, VT], abc.ABC):
     """
     SUB-DAG Task to execute parallel tasks and wait until all of them are in a terminal state before progressing to the next task
@@ -1009,84 +1474,121 @@ class ParallelCompositeTask(ITask[KT, VT], abc.ABC):
     """
 
     task_type: str = TaskType.PARALLEL_COMPOSITE.name
-    parallel_child_task_list: Set[UUID] = set()
+    parallel_child_task_list: Set[UUID] = _DEFAULT_PARALLEL_CHILDREN
     operator_type: str = TaskOperator.JOIN_ALL.name
     process_name: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.parallel_child_task_list is _DEFAULT_PARALLEL_CHILDREN:
+            self.parallel_child_task_list = set()
+
     async def stop(self) -> None:
         pass
 
     async def start(self, workflow_instance: Optional[ITemplateDAGInstance]) -> None:
         await asyncio.sleep(0)
-        if self.status.code in TERMINAL_STATUSES:
+        status = self.status
+        if status.code in TERMINAL_STATUSES:
             return await self.on_complete(
-                workflow_instance=workflow_instance, status=self.status
+                workflow_instance=workflow_instance, status=status
             )
-        if (
-            self.status.code == TaskStatusEnum.NOT_STARTED.name
-            or self.status.code == TaskStatusEnum.SUBMITTED.name
-        ) and workflow_instance:
-            self.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
-            self.time_submitted = int(time.time())
+        if status.code in STARTABLE_STATUSES and workflow_instance:
+            self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+            self.time_submitted = _event_now()
             await self.execute(
                 runtime_parameters=workflow_instance.runtime_parameters,
                 workflow_instance=workflow_instance,
             )
-            await dagger.service.services.Dagger.app._update_instance(task=workflow_instance)  # type: ignore
+            await _update_or_defer_instance(workflow_instance)
         logger.debug(
             f"Starting task {self.task_name} with parent task id {self.parent_id}, and task id {self.id}"
         )
+        children: List[ITask] = []
         for task_id in self.parallel_child_task_list:
             dag_instance = workflow_instance.get_task(id=task_id)  # type: ignore
             if dag_instance:
-                await dag_instance.start(workflow_instance)
+                children.append(dag_instance)
             else:
                 logger.error(
                     f"Could not find task instance for task with id: {task_id}. Unable to start."
                 )
+        if children:
+            # the children are independent by definition; start them
+            # concurrently and surface failures without cancelling siblings
+            results = await asyncio.gather(
+                *(child.start(workflow_instance) for child in children),
+                return_exceptions=True,
+            )
+            for child, result in zip(children, results):
+                if isinstance(result, BaseException):
+                    logger.error(
+                        f"Error starting parallel child task {child.id}. error {result}",
+                        exc_info=result,
+                    )
 
     async def execute(
         self, runtime_parameters: Dict[str, str], workflow_instance: ITask = None
     ) -> None:
         logger.debug(f"starting execution of ParallelCompositeTask {self.id}")
-        self.status = TaskStatus(
-            code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-        )
-        self.time_submitted = int(time.time())
+        self.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
+        self.time_submitted = _event_now()
 
     async def notify(
         self,
         status: TaskStatus,
         workflow_instance: Optional[ITemplateDAGInstance] = None,
+        completed_child_id: Optional[UUID] = None,
     ) -> None:  # pragma: no cover
-        """If not completed, runs the steps required for completion by calling on_complete()."""
-        atleast_one = False
-        all_in_terminal = True
-        if self.status.code != status.code:
-            # check if all the child tasks are in terminal states
+        """If not completed, runs the steps required for completion by calling on_complete().
+
+        Tracks terminal children in an in-process set so each notification is
+        O(1); the full child scan runs only once per process to seed the set
+        (covering rehydrated instances), instead of on every child transition
+        """
+        if self.status.code == status.code:
+            return
+        completed_children: Optional[Set[UUID]] = getattr(
+            self, "_completed_children", None
+        )
+        if completed_children is None:
+            # seed from the live child statuses on the first notification
+            completed_children = set()
+            unresolved_children: Set[UUID] = set()
             for task_id in self.parallel_child_task_list:
-                dag_instance: ITask = workflow_instance.get_task(task_id)  # type: ignore
+                dag_instance: Optional[ITask] = (
+                    workflow_instance.get_task(task_id) if workflow_instance else None
+                )
                 if dag_instance:
                     if dag_instance.status.code in TERMINAL_STATUSES:
-                        atleast_one = True
-                        if self.operator_type == TaskOperator.ATLEAST_ONE.name:
-                            break
-                    else:
-                        all_in_terminal = False
-                        if self.operator_type == TaskOperator.JOIN_ALL.name:
-                            break
+                        completed_children.add(task_id)
                 else:
+                    # a child that cannot be resolved never transitions; keep
+                    # it out of the denominator so it does not block JOIN_ALL,
+                    # but do not let it satisfy ATLEAST_ONE either
+                    unresolved_children.add(task_id)
                     logger.error(
                         f"Could not find task instance for task with id: {task_id}. Unable to notify."
                     )
-            if (
-                self.operator_type == TaskOperator.JOIN_ALL.name and all_in_terminal
-            ) or (self.operator_type == TaskOperator.ATLEAST_ONE.name and atleast_one):
-                await self.on_complete(
-                    workflow_instance=workflow_instance, status=status
-                )
+            self._completed_children = completed_children
+            self._unresolved_children = unresolved_children
+        elif (
+            completed_child_id is not None
+            and completed_child_id in self.parallel_child_task_list
+        ):
+            unresolved_children = self._unresolved_children
+            completed_children.add(completed_child_id)
+            unresolved_children.discard(completed_child_id)
+        else:
+            unresolved_children = self._unresolved_children
+        atleast_one = len(completed_children) > 0
+        all_in_terminal = len(completed_children) + len(unresolved_children) >= len(
+            self.parallel_child_task_list
+        )
+        if (self.operator_type == TaskOperator.JOIN_ALL.name and all_in_terminal) or (
+            self.operator_type == TaskOperator.ATLEAST_ONE.name and atleast_one
+        ):
+            await self.on_complete(workflow_instance=workflow_instance, status=status)
 
 
 class IProcessTemplateDAGInstance(INonLeafNodeTask[KT, VT], abc.ABC):
@@ -1108,6 +1610,19 @@ class CorrelatableMapValue(Record):
     correlatable_key_attr_value: str
 
 
+_DEFAULT_WORKFLOW_TASKS: Dict[UUID, ITask] = dict()
+"""Shared sentinel for the class-body tasks default; replaced with a fresh dict
+per instance in ITemplateDAGInstance.__post_init__."""
+
+_DEFAULT_SENSOR_CORRELETABLE_MAP: Dict[UUID, CorrelatableMapValue] = dict()
+"""Shared sentinel for the class-body sensor_tasks_to_correletable_map default;
+replaced with a fresh dict per instance in ITemplateDAGInstance.__post_init__."""
+
+_DEFAULT_RUNTIME_PARAMETERS: Dict[str, Any] = dict()
+"""Shared sentinel for the class-body runtime_parameters default; replaced with
+a fresh dict per instance in ITemplateDAGInstance.__post_init__."""
+
+
 class ITemplateDAGInstance(INonLeafNodeTask[KT, VT], abc.ABC):
     """
     A root node implementation of INonLeafNodeTask
@@ -1116,35 +1631,145 @@ class ITemplateDAGInstance(INonLeafNodeTask[KT, VT], abc.ABC):
     template_name: Optional[str] = None
     partition_key_lookup: Optional[str] = None
     task_type = TaskType.ROOT.name
-    tasks: Dict[UUID, ITask] = {}
-    sensor_tasks_to_correletable_map: Dict[UUID, CorrelatableMapValue] = {}
-    runtime_parameters: Dict[str, VT] = {}
+    tasks: Dict[UUID, ITask] = _DEFAULT_WORKFLOW_TASKS
+    sensor_tasks_to_correletable_map: Dict[
+        UUID, CorrelatableMapValue
+    ] = _DEFAULT_SENSOR_CORRELETABLE_MAP
+    runtime_parameters: Dict[str, VT] = _DEFAULT_RUNTIME_PARAMETERS
     update_count: int = 0
 
+    def __post_init__(self) -> None:
+        # the class-body dict defaults would otherwise be shared by every
+        # workflow instance, leaking tasks and runtime state across workflows
+        super().__post_init__()
+        if self.tasks is _DEFAULT_WORKFLOW_TASKS:
+            self.tasks = {}
+        if self.sensor_tasks_to_correletable_map is _DEFAULT_SENSOR_CORRELETABLE_MAP:
+            self.sensor_tasks_to_correletable_map = {}
+        if self.runtime_parameters is _DEFAULT_RUNTIME_PARAMETERS:
+            self.runtime_parameters = {}
+
     def add_task(self, task: ITask):
         self.tasks[task.id] = task
+        index = getattr(self, "_tasks_by_int", None)
+        if index is not None:
+            index[task.id.int] = task
+        cache = getattr(self, "_next_dag_cache", None)
+        if cache:
+            cache.clear()
+
+    def _tasks_by_int_index(self) -> Dict[int, ITask]:
+        """Mirror of the tasks dict keyed by UUID.int.
+
+        dict lookups on plain ints skip the UUID __hash__/__eq__ dispatch in
+        the hottest lookup of the module. The mirror is rebuilt lazily when
+        tasks were added outside of add_task
+        :return: the task instances keyed by the int value of their id
+        """
+        index = getattr(self, "_tasks_by_int", None)
+        if index is not None and len(index) == len(self.tasks):
+            return index
+        index = {task_id.int: task for task_id, task in self.tasks.items()}
+        self._tasks_by_int = index
+        return index
 
     def get_task(self, id: Optional[UUID]) -> Optional[ITask]:
-        if id == self.id:
-            return self
-        if id:
-            return self.tasks.get(id, None)
-        else:
+        if not id:
             return None
+        id_int = id.int
+        cached_id = getattr(self, "_id_int", None)
+        if cached_id is None or cached_id[0] is not self.id:
+            cached_id = (self.id, self.id.int)
+            self._id_int = cached_id
+        if id_int == cached_id[1]:
+            return self
+        return self._tasks_by_int_index().get(id_int, None)
+
+    def get_next_dag_instances(
+        self, task_id: UUID, next_dags: List[UUID]
+    ) -> List[ITask]:
+        """Resolve (and memoize) the next-dag task instances for a task.
+
+        The DAG topology is immutable once the workflow is created, so the
+        resolved child instances are cached per task id; add_task invalidates
+        the cache
+        :param task_id: the id of the task whose children are resolved
+        :param next_dags: the child task ids to resolve
+        :return: the resolved child task instances
+        """
+        cache: Optional[Dict[UUID, List[ITask]]] = getattr(
+            self, "_next_dag_cache", None
+        )
+        if cache is None:
+            cache = {}
+            self._next_dag_cache = cache
+        resolved = cache.get(task_id)
+        if resolved is None:
+            resolved = []
+            for next_dag_id in next_dags:
+                next_dag_instance = self.get_task(id=next_dag_id)
+                if next_dag_instance:
+                    resolved.append(next_dag_instance)
+                else:
+                    logger.error(
+                        f"Could not find the next DAG in the template with id: {next_dag_id} and thus unable to set to complete. Skipping."
+                    )
+            cache[task_id] = resolved
+        return resolved
+
+    def _attr_to_sensors_index(self) -> Dict[str, List[UUID]]:
+        """Reverse index of runtime parameter name to the sensor task ids bound
+        to it.
 
-    async def _update_global_runtime_parameters(self) -> None:
+        The index is rebuilt lazily whenever a sensor task is registered in
+        sensor_tasks_to_correletable_map; the attribute a sensor is bound to
+        never changes once registered
+        :return: the sensor task ids keyed by runtime parameter name
+        """
+        sensor_map = self.sensor_tasks_to_correletable_map
+        cached = getattr(self, "_attr_to_sensors", None)
+        if cached is not None and cached[0] == len(sensor_map):
+            return cached[1]
+        index: Dict[str, List[UUID]] = {}
+        for sensor_task_id, correletable_kv in sensor_map.items():
+            index.setdefault(correletable_kv.correlatable_key_attr, []).append(
+                sensor_task_id
+            )
+        self._attr_to_sensors = (len(sensor_map), index)
+        return index
+
+    async def _update_global_runtime_parameters(
+        self, changed_keys: Optional[Set[str]] = None
+    ) -> None:
+        """Refresh the correletable keys of sensor tasks whose bound runtime
+        parameter changed.
 
-        for (
-            sensor_task_id,
-            correletable_kv,
-        ) in self.sensor_tasks_to_correletable_map.items():
+        :param changed_keys: the runtime parameter names changed by the latest
+            message. Only the sensor tasks bound to those names are scanned;
+            when None every sensor task is scanned (recovery path)
+        """
+        sensor_map = self.sensor_tasks_to_correletable_map
+        if changed_keys is None:
+            sensor_task_ids: Iterable[UUID] = list(sensor_map.keys())
+        elif changed_keys:
+            attr_index = self._attr_to_sensors_index()
+            sensor_task_ids = [
+                sensor_task_id
+                for changed_key in changed_keys
+                for sensor_task_id in attr_index.get(changed_key, ())
+            ]
+        else:
+            return
+        for sensor_task_id in sensor_task_ids:
+            correletable_kv = sensor_map.get(sensor_task_id)
+            if correletable_kv is None:
+                continue
             new_runtime_value: str = self.runtime_parameters.get(correletable_kv.correlatable_key_attr, None)  # type: ignore
             existing_value = correletable_kv.correlatable_key_attr_value
             sensor_task_instance = self.get_task(id=sensor_task_id)
             if (
                 sensor_task_instance
-                and sensor_task_instance.status.code
-                in [TaskStatusEnum.NOT_STARTED.name, TaskStatusEnum.EXECUTING.name]
+                and sensor_task_instance.status.code in NON_TERMINAL_STATUSES
                 and new_runtime_value != existing_value
             ):
                 correletable_kv.correlatable_key_attr_value = new_runtime_value
@@ -1159,18 +1784,23 @@ class DefaultProcessTemplateDAGInstance(IProcessTemplateDAGInstance[str, str]):
     async def on_complete(
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         iterate: bool = True,
     ) -> None:
-        if (
-            hasattr(self, "max_run_duration_monitor_task_id")
-            and self.max_run_duration_monitor_task_id
-        ):
-            max_run_duration_monitor_task: ITask = await dagger.service.services.Dagger.app.get_instance(  # type: ignore
-                self.max_run_duration_monitor_task_id, log=False
+        # max_run_duration_monitor_task_id is a declared field on
+        # IProcessTemplateDAGInstance; truthiness alone is enough
+        if self.max_run_duration_monitor_task_id:
+            # setup_max_run_duration adds the monitor to the workflow's own
+            # tasks, so the global table fetch is only a fallback
+            max_run_duration_monitor_task: Optional[ITask] = (
+                workflow_instance.get_task(id=self.max_run_duration_monitor_task_id)
+                if workflow_instance
+                else None
             )
+            if max_run_duration_monitor_task is None:
+                max_run_duration_monitor_task = await _get_app().get_instance(  # type: ignore
+                    self.max_run_duration_monitor_task_id, log=False
+                )
             if max_run_duration_monitor_task:
                 await max_run_duration_monitor_task.on_complete(
                     iterate=iterate, workflow_instance=workflow_instance
@@ -1196,23 +1826,22 @@ class DefaultProcessTemplateDAGInstance(IProcessTemplateDAGInstance[str, str]):
         Sets up the max duration of this task to timeout
         :param wokflow_instance: The workflow instance
         """
-        if (
-            hasattr(self, "max_run_duration")
-            and self.max_run_duration != 0
-            and wokflow_instance
-        ):
+        if self.max_run_duration != 0 and wokflow_instance:
             max_run_duration_monitor_task: ITask = SkipOnMaxDurationTask(
                 id=uuid.uuid1(),
                 monitored_task_id=self.id,
-                time_to_execute=int(time.time()) + self.max_run_duration,
+                time_to_execute=_event_now() + self.max_run_duration,
             )
             wokflow_instance.add_task(task=max_run_duration_monitor_task)
-            max_run_duration_monitor_task.status = TaskStatus(
-                code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
-            )
+            max_run_duration_monitor_task.status = _STATUS_SINGLETONS[
+                TaskStatusEnum.EXECUTING
+            ]
             self.max_run_duration_monitor_task_id = max_run_duration_monitor_task.id
 
-            await dagger.service.services.Dagger.app._store_trigger_instance(task_instance=max_run_duration_monitor_task, wokflow_instance=wokflow_instance)  # type: ignore
+            await _get_app()._store_trigger_instance(task_instance=max_run_duration_monitor_task, wokflow_instance=wokflow_instance)  # type: ignore
+            max_run_duration_monitor_task.schedule_wait_for_monitored_task(
+                workflow_instance=wokflow_instance
+            )
 
     async def on_message(
         self, runtime_parameters: Dict[str, VT], *args: Any, **kwargs: Any
@@ -1252,9 +1881,7 @@ class MonitoredProcessTemplateDAGInstance(
     async def on_complete(
         self,
         workflow_instance: Optional[ITemplateDAGInstance],
-        status: TaskStatus = TaskStatus(
-            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
-        ),
+        status: TaskStatus = _STATUS_SINGLETONS[TaskStatusEnum.COMPLETED],
         iterate: bool = True,
     ) -> None:
         """Sets the status of the ITask to completed and starts the next ITask if there is one."""
@@ -1295,13 +1922,13 @@ class MonitoredProcessTemplateDAGInstance(
                     monitored_task_id=self.id,
                     time_to_execute=wait_time,
                 )
-                monitoring_task.status = TaskStatus(
-                    code=TaskStatusEnum.EXECUTING.name,
-                    value=TaskStatusEnum.EXECUTING.value,
-                )
+                monitoring_task.status = _STATUS_SINGLETONS[TaskStatusEnum.EXECUTING]
                 workflow_instance.add_task(task=monitoring_task)
                 self.monitoring_task_id = monitoring_task.id
-                await dagger.service.services.Dagger.app._store_trigger_instance(task_instance=monitoring_task, workflow_instance=workflow_instance)  # type: ignore
+                await _get_app()._store_trigger_instance(task_instance=monitoring_task, workflow_instance=workflow_instance)  # type: ignore
+                monitoring_task.schedule_wait_for_monitored_task(
+                    workflow_instance=workflow_instance
+                )
 
         logger.info(f"set up wait time {wait_time} task id {self.monitoring_task_id}")
 
@@ -1344,7 +1971,7 @@ class Trigger(Record, serializer="raw"):  # type: ignore
     Class To store the Trigger data. The time to execute a task
     """
 
-    trigger_time: Optional[int] = int(time.time())
+    trigger_time: Optional[int] = None
     id: Optional[UUID] = None
     workflow_id: Optional[UUID] = None
 
@@ -1362,6 +1989,20 @@ class CorreletableLookUpKey(Record, serializer="raw"):  # type: ignore
 
 
 class CorreletableKeyTasks(Record, serializer="raw"):  # type: ignore
-    lookup_keys: Set[CorreletableLookUpKey] = set()
+    # stored as a list since the move to tuple-keyed indexing, but older
+    # persisted instances and callers may still hand over a set
+    lookup_keys: Collection[CorreletableLookUpKey] = set()
     overflow_key: Optional[str] = None
     key: Optional[str] = None
+
+    def lookup_keys_index(self) -> Dict[Tuple[UUID, UUID], CorreletableLookUpKey]:
+        """
+        Index the lookup keys by their (workflow_id, task_id) pair. Membership
+        checks and removals key on the cheap tuple instead of hashing the
+        CorreletableLookUpKey record itself
+        :return: The lookup keys keyed by (workflow_id, task_id)
+        """
+        return {
+            (lookup_key.workflow_id, lookup_key.task_id): lookup_key
+            for lookup_key in self.lookup_keys
+        }
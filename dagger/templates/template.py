@@ -23,10 +23,10 @@ from dagger.tasks.task import (
     KafkaCommandTask,
     KafkaListenerTask,
     TaskOperator,
-    TaskStatus,
     TaskStatusEnum,
     TaskType,
     TriggerTask,
+    status_of,
 )
 from dagger.utils.utils import DAGIDGenerator
 
@@ -366,9 +366,7 @@ class DefaultTaskTemplate(TaskTemplate):
         :return: Instance of ITask.
         """
         task_instance.time_created = int(time.time())
-        task_instance.status = TaskStatus(
-            code=TaskStatusEnum.NOT_STARTED.name, value=TaskStatusEnum.NOT_STARTED.value
-        )
+        task_instance.status = status_of(TaskStatusEnum.NOT_STARTED)
         task_instance.task_name = f"{parent_name}.{self.name}"
         task_instance.next_dags = list()
         task_instance.allow_skip_to = self.allow_skip_to
@@ -748,9 +746,7 @@ class ParallelCompositeTaskTemplate(DefaultTaskTemplate):
         :return: Instance of ITask.
         """
         task_instance.time_created = int(time.time())
-        task_instance.status = TaskStatus(
-            code=TaskStatusEnum.NOT_STARTED.name, value=TaskStatusEnum.NOT_STARTED.value
-        )
+        task_instance.status = status_of(TaskStatusEnum.NOT_STARTED)
         task_instance.task_name = f"{parent_name}.{self.name}"
         task_instance.next_dags = list()
         task_instance.task_type = TaskType.PARALLEL_COMPOSITE.name
@@ -161,6 +161,32 @@ class TestDagger:
         ):
             assert ret_value is task
 
+    @pytest.mark.asyncio
+    async def test_process_engine_get_tasks_by_correlatable_keys_bulk(
+        self, pe_fixture, workflow_instance_fixture
+    ):
+        cor_instance = CorreletableKeyTasks()
+        task_id = uuid.uuid1()
+        lookup_key = CorreletableLookUpKey(workflow_instance_fixture.id, task_id)
+        cor_instance.lookup_keys = set()
+        cor_instance.lookup_keys.add(lookup_key)
+        cor_instance.overflow_key = None
+        task = ITask(task_id)
+        workflow_instance_fixture.add_task(task)
+        task.status.code = TaskStatusEnum.EXECUTING.name
+        pe_fixture._store.get_table_value = CoroutineMock(return_value=cor_instance)
+        pe_fixture._invoke_store_get_value_for_key_with_timer = CoroutineMock(
+            return_value=workflow_instance_fixture
+        )
+        yielded = []
+        async for wf, ret_value in pe_fixture._get_tasks_by_correlatable_keys_bulk(
+            [("id", "v1"), ("id", "v2")]
+        ):
+            yielded.append(ret_value)
+        assert yielded == [task, task]
+        # the shared workflow instance is read once despite two mappings
+        assert pe_fixture._invoke_store_get_value_for_key_with_timer.call_count == 1
+
     @pytest.mark.asyncio
     async def test_process_engine__store_root_template_instance(self, pe_fixture):
         pe_fixture._store.insert_key_value = CoroutineMock()
@@ -331,6 +357,39 @@ class TestDagger:
         )
         assert not pe_fixture.remove_task_from_correletable_keys_table.called
 
+    @pytest.mark.asyncio
+    async def test_remove_tasks_from_correletable_keys_table_bulk(
+        self, pe_fixture: Dagger, workflow_instance_fixture
+    ):
+        first_listener = KafkaListenerTask(uuid.uuid1())
+        first_listener.correlatable_key = "k1"
+        first_listener._topic = MagicMock()
+        first_listener._topic.get_topic_name = MagicMock(return_value="topic")
+        second_listener = KafkaListenerTask(uuid.uuid1())
+        second_listener.correlatable_key = "k1"
+        second_listener._topic = MagicMock()
+        second_listener._topic.get_topic_name = MagicMock(return_value="topic")
+        workflow_instance_fixture.runtime_parameters = {"k1": "v1"}
+        cr_tasks = CorreletableKeyTasks()
+        cr_tasks.key = "v1_topic"
+        cr_tasks.lookup_keys = {
+            CorreletableLookUpKey(workflow_instance_fixture.id, first_listener.id),
+            CorreletableLookUpKey(workflow_instance_fixture.id, second_listener.id),
+        }
+        pe_fixture._store.get_table_value = CoroutineMock(return_value=cr_tasks)
+        pe_fixture.persist_tasks_ids_for_correletable_keys = CoroutineMock()
+        await pe_fixture.remove_tasks_from_correletable_keys_table_bulk(
+            [first_listener, second_listener],
+            workflow_instance=workflow_instance_fixture,
+        )
+        # both tasks share the same key so the chunk list is read once
+        assert pe_fixture._store.get_table_value.call_count == 1
+        assert pe_fixture.persist_tasks_ids_for_correletable_keys.called
+        lookup_keys = pe_fixture.persist_tasks_ids_for_correletable_keys.call_args[1][
+            "lookup_keys"
+        ]
+        assert lookup_keys == []
+
     @pytest.mark.asyncio
     async def test_remove_root_template_instance(self, pe_fixture: Dagger):
         pe_fixture._remove_itask_instance = CoroutineMock()
@@ -1,3 +1,4 @@
+import asyncio
 import time
 import uuid
 from typing import Optional  # noqa: F401
@@ -33,6 +34,7 @@ from dagger.tasks.task import (
     TaskStatusEnum,
     Trigger,
     TriggerTask,
+    completion_event_for,
 )
 
 test = 2 * 1024**3
@@ -263,6 +265,32 @@ class TestTasks:
         )
         assert not parallel_composite_task_fixture.on_complete.called
 
+    @pytest.mark.asyncio
+    async def test_parallel_composite_task_notify_join_all_unresolvable_child(
+        self, parallel_composite_task_fixture, workflow_instance_fixture
+    ):
+        parallel_composite_task_fixture.status = TaskStatus(
+            code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
+        )
+        parallel_composite_task_fixture.operator_type = TaskOperator.JOIN_ALL.name
+
+        child_task1 = MagicMock()
+        child_task1.start = CoroutineMock()
+        child_task1.status.code = TaskStatusEnum.COMPLETED.name
+        id1 = uuid1()
+        id2 = uuid1()
+        parallel_composite_task_fixture.on_complete = CoroutineMock()
+        parallel_composite_task_fixture.parallel_child_task_list = [id1, id2]
+        # id2 is not registered on the workflow; it must not block completion
+        workflow_instance_fixture.tasks[id1] = child_task1
+        await parallel_composite_task_fixture.notify(
+            TaskStatus(
+                code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
+            ),
+            workflow_instance=workflow_instance_fixture,
+        )
+        assert parallel_composite_task_fixture.on_complete.called
+
     @pytest.mark.asyncio
     async def test_parallel_composite_task_notify_atleast_one_none_complete(
         self, parallel_composite_task_fixture, workflow_instance_fixture
@@ -439,6 +467,31 @@ class TestTasks:
             remaining_task.id
         ] == CorrelatableMapValue("k1", "10")
 
+    @pytest.mark.asyncio
+    async def test_update_global_runtime_parameters_changed_keys(
+        self, template_fixture
+    ):
+        dagger.service.services.Dagger.app = CoroutineMock()
+        dagger.service.services.Dagger.app._update_instance = CoroutineMock()
+        template_fixture.runtime_parameters = {"k1": "10", "k2": "20"}
+        sensor_task = SensorTask(uuid1())
+        template_fixture.add_task(sensor_task)
+        template_fixture.sensor_tasks_to_correletable_map = {
+            sensor_task.id: CorrelatableMapValue("k1", "0")
+        }
+        sensor_task.status.code = TaskStatusEnum.NOT_STARTED.name
+        sensor_task._update_correletable_key = CoroutineMock()
+        assert template_fixture._attr_to_sensors_index() == {"k1": [sensor_task.id]}
+        await template_fixture._update_global_runtime_parameters(changed_keys={"k2"})
+        assert not sensor_task._update_correletable_key.called
+        await template_fixture._update_global_runtime_parameters(changed_keys=set())
+        assert not sensor_task._update_correletable_key.called
+        await template_fixture._update_global_runtime_parameters(changed_keys={"k1"})
+        assert sensor_task._update_correletable_key.called
+        assert template_fixture.sensor_tasks_to_correletable_map[
+            sensor_task.id
+        ] == CorrelatableMapValue("k1", "10")
+
     @pytest.mark.asyncio
     async def test_executortask(self, executor_fixture, workflow_instance_fixture):
         assert executor_fixture.status.code == TaskStatusEnum.NOT_STARTED.name
@@ -496,6 +549,34 @@ class TestTasks:
         with pytest.raises(NotImplementedError):
             await decision_fixture.on_message(workflow_instance_fixture, {})
 
+    @pytest.mark.asyncio
+    async def test_decisiontask_memoized_evaluation(
+        self, decision_fixture, workflow_instance_fixture
+    ):
+        first_dag = uuid1()
+        second_dag = uuid1()
+        decision_fixture.task_name = "memoized_decision"
+        decision_fixture.next_dags = [first_dag, second_dag]
+        decision_fixture.memoize_evaluation = True
+        decision_fixture.evaluate = CoroutineMock(return_value=second_dag)
+        workflow_instance_fixture.runtime_parameters = {"key": "value"}
+        result = await decision_fixture._evaluate_memoized(workflow_instance_fixture)
+        assert result == second_dag
+        # second call with the same parameters hits the cache
+        result = await decision_fixture._evaluate_memoized(workflow_instance_fixture)
+        assert result == second_dag
+        assert decision_fixture.evaluate.call_count == 1
+        # different parameters miss the cache and re-evaluate
+        workflow_instance_fixture.runtime_parameters = {"key": "other"}
+        await decision_fixture._evaluate_memoized(workflow_instance_fixture)
+        assert decision_fixture.evaluate.call_count == 2
+        # unhashable parameter values fall back to evaluate on every call
+        workflow_instance_fixture.runtime_parameters = {"key": [1, 2, 3]}
+        result = await decision_fixture._evaluate_memoized(workflow_instance_fixture)
+        assert result == second_dag
+        await decision_fixture._evaluate_memoized(workflow_instance_fixture)
+        assert decision_fixture.evaluate.call_count == 4
+
     @pytest.mark.asyncio
     async def test_template_on_complete(self, template_fixture):
         assert template_fixture.status.code == TaskStatusEnum.NOT_STARTED.name
@@ -797,6 +878,35 @@ class TestTasks:
         )
         assert dagger.service.services.Dagger.app._remove_root_template_instance.called
 
+    @pytest.mark.asyncio
+    async def test_root_dag_cleanup_flushes(self, workflow_instance_fixture):
+        app = dagger.service.services.Dagger.app
+        app.get_monitoring_task = CoroutineMock()
+        app.remove_tasks_from_correletable_keys_table_bulk = CoroutineMock()
+        app._store.process_trigger_task_complete_bulk = CoroutineMock()
+        app._update_instance = CoroutineMock()
+        app._remove_root_template_instance = CoroutineMock()
+        app.delete_workflow_on_complete = False
+        executing_task = KafkaListenerTask(uuid1())
+        completed_task = KafkaCommandTask(uuid1())
+        completed_task.status = TaskStatus(
+            code=TaskStatusEnum.COMPLETED.name, value=TaskStatusEnum.COMPLETED.value
+        )
+        workflow_instance_fixture.add_task(executing_task)
+        workflow_instance_fixture.add_task(completed_task)
+        monitor = MagicMock()
+        monitor.status.code = TaskStatusEnum.EXECUTING.name
+        app.get_monitoring_task.side_effect = [monitor, None]
+        await workflow_instance_fixture.on_complete(
+            workflow_instance=workflow_instance_fixture
+        )
+        assert app.remove_tasks_from_correletable_keys_table_bulk.called
+        assert app._store.process_trigger_task_complete_bulk.called
+        # the still-executing monitor is completed as part of the cleanup
+        assert monitor.status.code == TaskStatusEnum.COMPLETED.name
+        assert app._update_instance.called
+        assert not app._remove_root_template_instance.called
+
     @pytest.mark.asyncio
     async def test_max_run_duration_monitoring_task_on_complete(
         self,
@@ -808,12 +918,77 @@ class TestTasks:
             CoroutineMock(return_value=[])
         )
         workflow_instance_fixture.status.code = TaskStatusEnum.EXECUTING.name
+        default_process_instance_fixture.status.code = TaskStatusEnum.EXECUTING.name
         await max_run_duration_monitoring_instance_fixture.process_monitored_task(
             default_process_instance_fixture,
             workflow_instance=workflow_instance_fixture,
         )
         assert max_run_duration_monitoring_instance_fixture.get_remaining_tasks.called
 
+    @pytest.mark.asyncio
+    async def test_monitoring_task_wait_for_monitored_task_timeout(
+        self, default_monitoring_instance_fixture, workflow_instance_fixture
+    ):
+        default_monitoring_instance_fixture.monitored_task_id = uuid1()
+        default_monitoring_instance_fixture.time_to_execute = int(time.time())
+        default_monitoring_instance_fixture.execute = CoroutineMock()
+        await default_monitoring_instance_fixture.wait_for_monitored_task(
+            workflow_instance=workflow_instance_fixture
+        )
+        assert default_monitoring_instance_fixture.execute.called
+
+    @pytest.mark.asyncio
+    async def test_monitoring_task_wait_for_monitored_task_completed(
+        self, default_monitoring_instance_fixture, workflow_instance_fixture
+    ):
+        monitored_task_id = uuid1()
+        default_monitoring_instance_fixture.monitored_task_id = monitored_task_id
+        default_monitoring_instance_fixture.time_to_execute = int(time.time()) + 60
+        default_monitoring_instance_fixture.execute = CoroutineMock()
+        completion_event_for(monitored_task_id).set()
+        await default_monitoring_instance_fixture.wait_for_monitored_task(
+            workflow_instance=workflow_instance_fixture
+        )
+        assert not default_monitoring_instance_fixture.execute.called
+
+    @pytest.mark.asyncio
+    async def test_monitoring_task_wait_without_monitored_task(
+        self, default_monitoring_instance_fixture
+    ):
+        default_monitoring_instance_fixture.execute = CoroutineMock()
+        await default_monitoring_instance_fixture.wait_for_monitored_task(None)
+        assert not default_monitoring_instance_fixture.execute.called
+
+    def test_schedule_wait_without_running_loop(
+        self, default_monitoring_instance_fixture
+    ):
+        # outside an event loop scheduling the waiter is a no-op
+        default_monitoring_instance_fixture.monitored_task_id = uuid1()
+        default_monitoring_instance_fixture.schedule_wait_for_monitored_task(None)
+
+    @pytest.mark.asyncio
+    async def test_monitoring_task_waiter_clears_batch_context(
+        self, default_monitoring_instance_fixture, workflow_instance_fixture
+    ):
+        default_monitoring_instance_fixture.monitored_task_id = uuid1()
+        default_monitoring_instance_fixture.time_to_execute = int(time.time())
+        default_monitoring_instance_fixture.execute = CoroutineMock()
+        token_now = dagger.tasks.task._EVENT_NOW.set(123)
+        token_dirty = dagger.tasks.task._DIRTY_WORKFLOWS.set({})
+        try:
+            await asyncio.get_running_loop().create_task(
+                default_monitoring_instance_fixture.wait_for_monitored_task(
+                    workflow_instance_fixture
+                )
+            )
+            # the waiter only clears its own context copy
+            assert dagger.tasks.task._EVENT_NOW.get() == 123
+            assert dagger.tasks.task._DIRTY_WORKFLOWS.get() == {}
+        finally:
+            dagger.tasks.task._DIRTY_WORKFLOWS.reset(token_dirty)
+            dagger.tasks.task._EVENT_NOW.reset(token_now)
+        assert default_monitoring_instance_fixture.execute.called
+
     @pytest.mark.asyncio
     async def test_default_monitoring_task_on_complete_not_called(
         self, default_monitoring_instance_fixture, workflow_instance_fixture
@@ -940,22 +1115,27 @@ class TestKafkaAgent:
         )
         generator_mock = MagicMock()
         generator_mock.__aiter__.return_value = [(workflow_instance_fixture, task)]
-        agent.app._get_tasks_by_correlatable_key.return_value = generator_mock
+        agent.app._get_tasks_by_correlatable_keys_bulk.return_value = generator_mock
         listener.get_correlatable_keys_from_payload = CoroutineMock(
             return_value=[("id", "v1"), ("id2", "v2")]
         )
         stream = asynctest.MagicMock()
-        stream.__aiter__.return_value = [range(1)]
+        stream.take.return_value.__aiter__.return_value = [[range(1)]]
         await agent.process_event(stream)
         assert task.on_message.called
         assert task.on_complete.called
         assert skipped_task.on_complete.called
-        assert agent.app._get_tasks_by_correlatable_key.call_count == 2
+        assert agent.app._get_tasks_by_correlatable_keys_bulk.call_count == 1
+        agent.app._get_tasks_by_correlatable_keys_bulk.assert_called_with(
+            [("id", "v1_topic"), ("id2", "v2_topic")], get_completed=True
+        )
 
         # Executing task but on_message returned False, assert on_complete not called
         task.on_message = CoroutineMock(return_value=False)
         task.on_complete = CoroutineMock()
-        task.status.code = TaskStatusEnum.EXECUTING.name
+        task.status = TaskStatus(
+            code=TaskStatusEnum.EXECUTING.name, value=TaskStatusEnum.EXECUTING.value
+        )
         await agent.process_event(stream)
         assert task.on_message.called
         assert not task.on_complete.called
@@ -1014,11 +1194,78 @@ class TestKafkaAgent:
             (workflow_instance_fixture, task1),
             (workflow_instance_fixture, task2),
         ]
-        agent.app._get_tasks_by_correlatable_key.return_value = generator_mock2
+        agent.app._get_tasks_by_correlatable_keys_bulk.return_value = generator_mock2
 
         stream = asynctest.MagicMock()
-        stream.__aiter__.return_value = range(1)
+        stream.take.return_value.__aiter__.return_value = [[0]]
         await agent.process_event(stream)
         assert task1.on_message.called
         assert task1.on_complete.called
         assert not task2.on_message.called
+
+    @pytest.mark.asyncio
+    async def test_update_or_defer_instance(self, workflow_instance_fixture):
+        dagger.service.services.Dagger.app = CoroutineMock()
+        dagger.service.services.Dagger.app._update_instance = CoroutineMock()
+        await dagger.tasks.task._update_or_defer_instance(workflow_instance_fixture)
+        assert dagger.service.services.Dagger.app._update_instance.called
+
+        dagger.service.services.Dagger.app._update_instance.reset_mock()
+        token = dagger.tasks.task._DIRTY_WORKFLOWS.set({})
+        try:
+            await dagger.tasks.task._update_or_defer_instance(workflow_instance_fixture)
+            await dagger.tasks.task._update_or_defer_instance(workflow_instance_fixture)
+            assert not dagger.service.services.Dagger.app._update_instance.called
+            assert dagger.tasks.task._DIRTY_WORKFLOWS.get() == {
+                workflow_instance_fixture.id: workflow_instance_fixture
+            }
+        finally:
+            dagger.tasks.task._DIRTY_WORKFLOWS.reset(token)
+
+    def test_group_events_by_correlatable_key(self):
+        e1 = ("e1", [("id", "v1")])
+        e2 = ("e2", [("id", "v2")])
+        e3 = ("e3", [("id", "v1")])
+        groups = KafkaAgent._group_events_by_correlatable_key([e1, e2, e3])
+        assert groups == [[e1, e3], [e2]]
+
+        # an event spanning two groups merges them while keeping arrival order
+        e4 = ("e4", [("id", "v1"), ("id2", "v2")])
+        e5 = ("e5", [("id", "v2")])
+        groups = KafkaAgent._group_events_by_correlatable_key([e1, e2, e4, e5])
+        assert groups == [[e1, e2, e4, e5]]
+
+        # events without mappings have no ordering dependency on anything
+        e6 = ("e6", None)
+        groups = KafkaAgent._group_events_by_correlatable_key([e6, e1])
+        assert groups == [[e6], [e1]]
+
+    @pytest.mark.asyncio
+    async def test_process_event_batch_concurrent_groups(
+        self, workflow_instance_fixture
+    ):
+        app = MagicMock()
+        app.dd_sensor = None
+        app._update_instance = CoroutineMock()
+        topic = MagicMock()
+        topic.get_topic_name = MagicMock(return_value="topic")
+        listener = KafkaListenerTask(uuid1())
+        listener.get_correlatable_keys_from_payload = CoroutineMock(
+            side_effect=[[("id", "v1")], [("id", "v2")]]
+        )
+        processed = []
+
+        class TrackingAgent(KafkaAgent):
+            async def process_event_helper(self, event, mappings=None):
+                if event == "boom":
+                    raise ValueError("boom")
+                processed.append(event)
+                dirty = dagger.tasks.task._DIRTY_WORKFLOWS.get()
+                dirty[workflow_instance_fixture.id] = workflow_instance_fixture
+
+        agent = TrackingAgent(app=app, topic=topic, task=listener)
+        await agent.process_event_batch(["ok", "boom"])
+        # the failing group is logged while the surviving group's deferred
+        # workflow write still flushes
+        assert processed == ["ok"]
+        app._update_instance.assert_called_once_with(task=workflow_instance_fixture)